@@ -5,7 +5,7 @@ SQL Server database for persistent conversation storage and analytics.
 
 import pyodbc
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import json
 import time
 
@@ -28,10 +28,16 @@ def _get_connection_string():
     return (f"DRIVER={{{driver}}};SERVER={server};"
             f"DATABASE={config['database']};UID={config['user']};PWD={config['password']}")
 
+# Must be set before the first connect: tells the ODBC driver manager to
+# keep physical connections alive and hand them back on the next
+# pyodbc.connect, so short scripts (verify_themes, test_search) and the
+# action server skip the TCP + login handshake on every borrow.
+pyodbc.pooling = True
+
 def _get_connection():
     """Get connection."""
-    # pyodbc handles pooling at the driver manager level usually.
-    # We create a new connection object each time but underlying physical connection might be pooled.
+    # Cheap: with pooling on, connect() normally rebinds a pooled
+    # physical connection rather than opening a new one.
     return pyodbc.connect(_get_connection_string())
 
 def _release_connection(conn):
@@ -513,6 +519,57 @@ def add_kb_article(title: str, content: str, url: str = None, refresh_cache: boo
     finally:
         _release_connection(conn)
 
+def add_kb_articles_bulk(records: List[Tuple[str, str, Optional[str]]], refresh_cache: bool = True) -> int:
+    """Add many knowledge base articles in one transaction.
+
+    Args:
+        records: (title, content, url) tuples; url may be None
+        refresh_cache: If True, reload KB cache once after the batch
+
+    Existing urls are updated and new ones inserted via one executemany
+    per group instead of a round trip per article. Returns the number
+    of articles written.
+    """
+    if not records:
+        return 0
+    conn = _get_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT url FROM knowledge_base WHERE url IS NOT NULL")
+        existing_urls = {row[0] for row in cursor.fetchall()}
+
+        updates = []
+        inserts = []
+        for title, content, url in records:
+            if url and url in existing_urls:
+                updates.append((title, content, url))
+            else:
+                inserts.append((title, content, url))
+
+        cursor.fast_executemany = True
+        if updates:
+            cursor.executemany(
+                "UPDATE knowledge_base SET title = ?, content = ?, created_at = GETDATE() WHERE url = ?",
+                updates
+            )
+        if inserts:
+            cursor.executemany(
+                "INSERT INTO knowledge_base (title, content, url) VALUES (?, ?, ?)",
+                inserts
+            )
+        conn.commit()
+
+        # One cache reload for the whole batch
+        if refresh_cache:
+            _load_kb_cache()
+
+        return len(records)
+    except Exception as e:
+        print(f"Error adding KB articles in bulk: {e}")
+        return 0
+    finally:
+        _release_connection(conn)
+
 def search_kb(query: str) -> List[Dict]:
     """Search knowledge base chunks for query using exact and keyword matching.
     Returns list of dicts with: title, content, url, article_id
@@ -1014,6 +1071,35 @@ def create_theme(name: str, settings: str, is_default: bool = False) -> int:
     finally:
         _release_connection(conn)
 
+def create_themes_bulk(themes: List[Tuple[str, str, bool]]) -> List[int]:
+    """Insert several themes in one transaction (one commit/fsync).
+
+    Args:
+        themes: (name, settings_json, is_default) tuples
+
+    Returns:
+        List of new theme ids, in input order
+    """
+    if not themes:
+        return []
+    conn = _get_connection()
+    try:
+        cursor = conn.cursor()
+        if any(is_default for _, _, is_default in themes):
+            cursor.execute('UPDATE themes SET is_default = 0')
+        new_ids = []
+        for name, settings, is_default in themes:
+            cursor.execute('''
+                INSERT INTO themes (name, settings, is_default, created_at, updated_at)
+                OUTPUT INSERTED.id
+                VALUES (?, ?, ?, GETDATE(), GETDATE())
+            ''', (name, settings, 1 if is_default else 0))
+            new_ids.append(cursor.fetchone()[0])
+        conn.commit()
+        return new_ids
+    finally:
+        _release_connection(conn)
+
 def update_theme(theme_id: int, name: str = None, settings: str = None, is_default: bool = None):
     conn = _get_connection()
     try:
@@ -1,1646 +1,2114 @@
-"""
-nopCommerce API Service Module
-Handles all API interactions with nopCommerce v4.9
-"""
-
-import logging
-import requests
-import base64
-from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
-
-logger = logging.getLogger(__name__)
-
-
-class NopCommerceService:
-    """
-    nopCommerce REST API Service
-    
-    Provides methods for:
-    - Customer authentication (login/logout/token management)
-    - Product operations (search, details, stock)
-    - Order operations (tracking, invoice, status updates)
-    """
-    
-    def __init__(self, api_url: str, secret_key: str, admin_username: Optional[str] = None, admin_password: Optional[str] = None, verify_ssl: bool = True):
-        """
-        Initialize the nopCommerce service.
-        
-        Args:
-            api_url: Base URL for the nopCommerce API (e.g., https://store.com/api)
-            secret_key: The API secret key generated in nopCommerce admin
-        """
-        self.api_url = api_url.rstrip('/')
-        self.secret_key = secret_key
-        self.access_token = None
-        self.refresh_token = None
-        self.token_expiry = None
-        self.admin_username = admin_username
-        self.admin_password = admin_password
-        self.admin_access_token = None
-        self.admin_token_expiry = None
-        self.admin_profile = None
-        self.verify_ssl = verify_ssl
-
-    def _get_public_base_url(self) -> str:
-        """Get base URL for public API endpoints."""
-        base_url = self.api_url
-        if base_url.endswith("/api"):
-            base_url = base_url[:-4]
-        return base_url
-    
-    # =========================================================================
-    # AUTHENTICATION
-    # =========================================================================
-    
-    def login(self, username: str, password: str) -> Dict[str, Any]:
-        """
-        Authenticate a customer/user with nopCommerce.
-        
-        Args:
-            username: Customer email or username
-            password: Customer password
-            
-        Returns:
-            Dict with 'success', 'access_token', 'customer_id', 'customer_name', 'error'
-        """
-        # Try different authentication endpoints based on common API plugin patterns
-        endpoints = [
-            "/token",  # SevenSpikes/api-plugin-for-nopcommerce
-            "/api-backend/Authenticate/GetToken",  # Official Web API
-            "/api/PublicCustomer/Login",  # NopAdvance
-        ]
-        
-        for endpoint in endpoints:
-            result = self._try_login_endpoint(endpoint, username, password)
-            if result.get("success"):
-                return result
-        
-        # If none worked, return the last error
-        return {
-            "success": False,
-            "access_token": None,
-            "refresh_token": None,
-            "customer_id": None,
-            "customer_name": None,
-            "error": "Authentication failed. Please check your credentials and API configuration."
-        }
-    
-    def _try_login_endpoint(self, endpoint: str, username: str, password: str) -> Dict[str, Any]:
-        """Try a specific login endpoint."""
-        url = f"{self.api_url}{endpoint}"
-        
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
-        
-        # Add API key header if available (for plugins that require it)
-        if self.secret_key:
-            headers["X-API-KEY"] = self.secret_key
-            headers["Authorization"] = f"Bearer {self.secret_key}"
-        
-        # Standard payload format
-        payload = {
-            "username": username,
-            "email": username,
-            "UsernameOrEmail": username,
-            "password": password,
-            "Password": password,
-            "grant_type": "password"
-        }
-        
-        try:
-            response = requests.post(url, headers=headers, json=payload, timeout=15, verify=self.verify_ssl)
-            
-            if response.status_code == 200:
-                data = response.json()
-                
-                # Handle different response formats from various plugins
-                access_token = (
-                    data.get("access_token") or 
-                    data.get("AccessToken") or 
-                    data.get("token") or
-                    data.get("Token")
-                )
-                
-                refresh_token = (
-                    data.get("refresh_token") or 
-                    data.get("RefreshToken")
-                )
-                
-                if access_token:
-                    self.access_token = access_token
-                    self.refresh_token = refresh_token
-                    
-                    # Calculate token expiry
-                    expires_in = data.get("expires_in", data.get("ExpiresIn", 3600))
-                    self.token_expiry = datetime.now() + timedelta(seconds=expires_in)
-                    
-                    # Get customer info
-                    customer_info = self._get_current_customer()
-                    
-                    return {
-                        "success": True,
-                        "access_token": access_token,
-                        "refresh_token": refresh_token,
-                        "customer_id": customer_info.get("id") if customer_info else data.get("customer_id"),
-                        "customer_name": customer_info.get("name") if customer_info else username,
-                        "error": None
-                    }
-            
-            # Parse error message
-            error_msg = "Invalid username or password"
-            try:
-                error_data = response.json()
-                if isinstance(error_data, dict):
-                    error_msg = error_data.get("message") or error_data.get("Message") or error_msg
-                elif isinstance(error_data, list) and len(error_data) > 0:
-                    error_msg = str(error_data[0])
-            except:
-                pass
-            
-            return {
-                "success": False,
-                "access_token": None,
-                "refresh_token": None,
-                "customer_id": None,
-                "customer_name": None,
-                "error": error_msg
-            }
-            
-        except requests.exceptions.RequestException as e:
-            logger.debug(f"Login attempt to {endpoint} failed: {e}")
-            return {
-                "success": False,
-                "access_token": None,
-                "refresh_token": None,
-                "customer_id": None,
-                "customer_name": None,
-                "error": f"Connection error: {str(e)}"
-            }
-    
-    def _get_current_customer(self) -> Optional[Dict[str, Any]]:
-        """Get current logged-in customer info."""
-        if not self.access_token:
-            return None
-        
-        endpoints = [
-            "/customers/current",
-            "/api/customers/current",
-            "/api/PublicCustomer/GetCurrentCustomer"
-        ]
-        
-        for endpoint in endpoints:
-            try:
-                url = f"{self.api_url}{endpoint}"
-                headers = self._get_auth_headers()
-                response = requests.get(url, headers=headers, timeout=10, verify=self.verify_ssl)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    # Handle nested response
-                    customer = data.get("customer") or data.get("Customer") or data
-                    return {
-                        "id": customer.get("id") or customer.get("Id"),
-                        "name": customer.get("first_name") or customer.get("FirstName") or customer.get("email"),
-                        "email": customer.get("email") or customer.get("Email"),
-                        "full_name": f"{customer.get('FirstName', '')} {customer.get('LastName', '')}".strip()
-                    }
-            except:
-                continue
-        
-        return None
-    
-    def refresh_access_token(self) -> bool:
-        """Refresh the access token using refresh token."""
-        if not self.refresh_token:
-            return False
-        
-        url = f"{self.api_url}/token"
-        headers = {"Content-Type": "application/json"}
-        payload = {
-            "grant_type": "refresh_token",
-            "refresh_token": self.refresh_token
-        }
-        
-        try:
-            response = requests.post(url, headers=headers, json=payload, timeout=10, verify=self.verify_ssl)
-            if response.status_code == 200:
-                data = response.json()
-                self.access_token = data.get("access_token")
-                self.refresh_token = data.get("refresh_token", self.refresh_token)
-                expires_in = data.get("expires_in", 3600)
-                self.token_expiry = datetime.now() + timedelta(seconds=expires_in)
-                return True
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Token refresh failed: {e}")
-        
-        return False
-    
-    def _get_auth_headers(self) -> Dict[str, str]:
-        """Get headers with authentication token."""
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
-        
-        if self.access_token:
-            headers["Authorization"] = f"Bearer {self.access_token}"
-        
-        if self.secret_key:
-            headers["X-API-KEY"] = self.secret_key
-        
-        return headers
-
-    def _get_admin_base_url(self) -> str:
-        """Get base URL for admin API endpoints."""
-        base_url = self.api_url
-        if base_url.endswith("/api"):
-            base_url = base_url[:-4]
-        return base_url
-
-    def _get_admin_headers(self) -> Dict[str, str]:
-        """Get headers with admin authentication token."""
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
-        if self.admin_access_token:
-            headers["Authorization"] = f"Bearer {self.admin_access_token}"
-        if self.secret_key:
-            headers["X-API-KEY"] = self.secret_key
-        return headers
-
-    def _is_admin_token_valid(self) -> bool:
-        """Check if the current admin token is still valid."""
-        if not self.admin_access_token:
-            return False
-        if not self.admin_token_expiry:
-            return True
-        return datetime.now() < self.admin_token_expiry
-
-    def admin_login(self, username: Optional[str] = None, password: Optional[str] = None) -> Dict[str, Any]:
-        """Authenticate as admin using the Admin API token endpoint."""
-        username = username or self.admin_username
-        password = password or self.admin_password
-        if not username or not password:
-            return {
-                "success": False,
-                "access_token": None,
-                "error": "Admin credentials are not configured."
-            }
-
-        url = f"{self._get_admin_base_url()}/api/admin/token"
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
-        if self.secret_key:
-            headers["X-API-KEY"] = self.secret_key
-
-        payload = {
-            "username": username,
-            "password": password
-        }
-
-        try:
-            response = requests.post(url, headers=headers, json=payload, timeout=15, verify=self.verify_ssl)
-            if response.status_code == 200:
-                data = response.json()
-                token = (
-                    data.get("AccessToken") or
-                    data.get("accessToken") or
-                    data.get("access_token") or
-                    data.get("token") or
-                    data.get("Token") or
-                    data.get("jwt")
-                )
-                if token:
-                    self.admin_access_token = token
-                    # Store admin user profile from token response
-                    self.admin_profile = {
-                        "username": username,
-                        "email": data.get("email") or data.get("Email") or username,
-                        "firstName": data.get("firstName") or data.get("FirstName") or data.get("first_name"),
-                        "lastName": data.get("lastName") or data.get("LastName") or data.get("last_name"),
-                        "name": f"{data.get('FirstName', '')} {data.get('LastName', '')}".strip()
-                        # data.get("name") or data.get("Name") or data.get("displayName") or data.get("DisplayName"),
-                    }
-                    expires_in = data.get("expires_in") or data.get("expiresIn")
-                    if expires_in:
-                        try:
-                            self.admin_token_expiry = datetime.now() + timedelta(seconds=int(expires_in))
-                        except (ValueError, TypeError):
-                            self.admin_token_expiry = None
-                    return {
-                        "success": True,
-                        "access_token": token,
-                        "error": None
-                    }
-
-            error_msg = "Admin authentication failed."
-            try:
-                error_data = response.json()
-                if isinstance(error_data, dict):
-                    error_msg = error_data.get("message") or error_data.get("Message") or error_msg
-            except Exception:
-                pass
-
-            return {
-                "success": False,
-                "access_token": None,
-                "error": error_msg
-            }
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Admin login failed: {e}")
-            return {
-                "success": False,
-                "access_token": None,
-                "error": f"Connection error: {str(e)}"
-            }
-
-    def _ensure_admin_token(self) -> bool:
-        """Ensure an admin token is available."""
-        if self._is_admin_token_valid():
-            # Validate token via /api/admin/token/me
-            token_check = self.admin_get_token_me()
-            if token_check.get("success"):
-                return True
-        result = self.admin_login()
-        return result.get("success", False)
-
-    def _admin_request(self, method: str, path: str, **kwargs) -> Optional[requests.Response]:
-        """Perform an admin API request with automatic token handling."""
-        if not self._ensure_admin_token():
-            return None
-
-        url = f"{self._get_admin_base_url()}{path}"
-        headers = kwargs.pop("headers", None) or self._get_admin_headers()
-        try:
-            response = requests.request(method, url, headers=headers, timeout=15, verify=self.verify_ssl, **kwargs)
-            if response.status_code in [401, 403] and self.admin_username and self.admin_password:
-                if self.admin_login().get("success"):
-                    headers = self._get_admin_headers()
-                    response = requests.request(method, url, headers=headers, timeout=15, verify=self.verify_ssl, **kwargs)
-            return response
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Admin request failed for {path}: {e}")
-            return None
-    
-    def is_token_valid(self) -> bool:
-        """Check if the current access token is still valid."""
-        if not self.access_token or not self.token_expiry:
-            return False
-        return datetime.now() < self.token_expiry
-
-    def _normalize_product(self, product: Dict[str, Any]) -> Dict[str, Any]:
-        """Normalize product data from different API formats."""
-        return {
-            "id": product.get("id") or product.get("Id"),
-            "name": product.get("name") or product.get("Name"),
-            "short_description": product.get("short_description") or product.get("ShortDescription") or "",
-            "full_description": product.get("full_description") or product.get("FullDescription") or "",
-            "sku": product.get("sku") or product.get("Sku") or "",
-            "gtin": product.get("gtin") or product.get("Gtin") or "",
-            "manufacturer_part_number": product.get("manufacturer_part_number") or product.get("ManufacturerPartNumber") or "",
-            "price": product.get("price") or product.get("Price") or 0,
-            "min_price": product.get("min_price") or product.get("MinPrice"),
-            "price_a": product.get("price_a") or product.get("TierPriceA"),
-            "price_b": product.get("price_b") or product.get("TierPriceB"),
-            "price_c": product.get("price_c") or product.get("TierPriceC"),
-            "old_price": product.get("old_price") or product.get("OldPrice"),
-            "special_price": product.get("special_price") or product.get("SpecialPrice"),
-            "discount_amount": product.get("discount_amount") or product.get("DiscountAmount"),
-            "cost": product.get("product_cost") or product.get("ProductCost"),
-            "stock_quantity": product.get("stock_quantity") or product.get("StockQuantity") or 0,
-            "in_stock": (product.get("stock_quantity") or product.get("StockQuantity") or 0) > 0,
-            "available_start_date": product.get("available_start_date_time_utc") or product.get("AvailableStartDateTimeUtc"),
-            "available_end_date": product.get("available_end_date_time_utc") or product.get("AvailableEndDateTimeUtc"),
-            "warehouse_id": product.get("warehouse_id") or product.get("WarehouseId"),
-            "min_stock_quantity": product.get("min_stock_quantity") or product.get("MinStockQuantity") or 0,
-            "notify_low_stock": product.get("notify_admin_for_quantity_below") or product.get("NotifyAdminForQuantityBelow"),
-            "manage_inventory": product.get("manage_inventory_method") or product.get("ManageInventoryMethod"),
-            "allow_back_in_stock": product.get("allow_back_in_stock_subscriptions") or product.get("AllowBackInStockSubscriptions"),
-            "weight": product.get("weight") or product.get("Weight") or 0,
-            "length": product.get("length") or product.get("Length") or 0,
-            "width": product.get("width") or product.get("Width") or 0,
-            "height": product.get("height") or product.get("Height") or 0,
-            "is_free_shipping": product.get("is_free_shipping") or product.get("IsFreeShipping") or False,
-            "additional_shipping_charge": product.get("additional_shipping_charge") or product.get("AdditionalShippingCharge") or 0,
-            "is_tax_exempt": product.get("is_tax_exempt") or product.get("IsTaxExempt") or False,
-            "tax_category_id": product.get("tax_category_id") or product.get("TaxCategoryId"),
-            "published": product.get("published") or product.get("Published") or False,
-            "deleted": product.get("deleted") or product.get("Deleted") or False,
-            "created_on": product.get("created_on_utc") or product.get("CreatedOnUtc"),
-            "updated_on": product.get("updated_on_utc") or product.get("UpdatedOnUtc"),
-            "product_type": product.get("product_type") or product.get("ProductType") or product.get("product_type_id") or product.get("ProductTypeId"),
-            "vendor_id": product.get("vendor_id") or product.get("VendorId"),
-            "vendor_name": product.get("vendor_name") or product.get("VendorName") or "",
-            "manufacturer_id": product.get("manufacturer_id") or product.get("ManufacturerId"),
-            "manufacturer_name": product.get("manufacturer_name") or product.get("ManufacturerName") or "",
-            "approved_rating_sum": product.get("approved_rating_sum") or product.get("ApprovedRatingSum") or 0,
-            "approved_total_reviews": product.get("approved_total_reviews") or product.get("ApprovedTotalReviews") or 0,
-            "average_rating": self._calculate_average_rating(product),
-            "display_order": product.get("display_order") or product.get("DisplayOrder") or 0,
-            "order_minimum_quantity": product.get("order_minimum_quantity") or product.get("OrderMinimumQuantity") or 1,
-            "order_maximum_quantity": product.get("order_maximum_quantity") or product.get("OrderMaximumQuantity") or 10000,
-            "disable_buy_button": product.get("disable_buy_button") or product.get("DisableBuyButton") or False,
-            "disable_wishlist_button": product.get("disable_wishlist_button") or product.get("DisableWishlistButton") or False,
-            "call_for_price": product.get("call_for_price") or product.get("CallForPrice") or False,
-            "is_rental": product.get("is_rental") or product.get("IsRental") or False,
-            "is_downloadable": product.get("is_download") or product.get("IsDownload") or False,
-            "mark_as_new": product.get("mark_as_new") or product.get("MarkAsNew") or False,
-            "image_url": self._get_product_image(product),
-            "images": product.get("images") or product.get("Images") or product.get("product_pictures") or product.get("ProductPictures") or [],
-            "categories": product.get("categories") or product.get("Categories") or [],
-            "tags": product.get("tags") or product.get("Tags") or product.get("product_tags") or product.get("ProductTags") or [],
-            "attributes": product.get("attributes") or product.get("Attributes") or product.get("product_attributes") or product.get("ProductAttributes") or [],
-            "tier_prices": product.get("tier_prices") or product.get("TierPrices") or [],
-            "related_products": product.get("related_products") or product.get("RelatedProducts") or [],
-            "cross_sell_products": product.get("cross_sells") or product.get("CrossSells") or []
-        }
-
-    def _calculate_average_rating(self, product: Dict[str, Any]) -> float:
-        """Calculate average rating from approved rating sum and total reviews."""
-        rating_sum = product.get("approved_rating_sum") or product.get("ApprovedRatingSum") or 0
-        total_reviews = product.get("approved_total_reviews") or product.get("ApprovedTotalReviews") or 0
-        if total_reviews > 0:
-            return round(rating_sum / total_reviews, 2)
-        return 0.0
-
-    def _normalize_customer(self, customer: Dict[str, Any]) -> Dict[str, Any]:
-        """Normalize customer data."""
-        return {
-            "id": customer.get("id") or customer.get("Id"),
-            "customer_guid": customer.get("customer_guid") or customer.get("CustomerGuid"),
-            "email": customer.get("email") or customer.get("Email"),
-            "username": customer.get("username") or customer.get("Username") or customer.get("email"),
-            "first_name": customer.get("first_name") or customer.get("FirstName"),
-            "last_name": customer.get("last_name") or customer.get("LastName"),
-            "full_name": customer.get("full_name") or customer.get("FullName") or f"{customer.get('first_name', '')} {customer.get('last_name', '')}".strip() or f"{customer.get('FirstName', '')} {customer.get('LastName', '')}".strip(),
-            "gender": customer.get("gender") or customer.get("Gender"),
-            "date_of_birth": customer.get("date_of_birth") or customer.get("DateOfBirth"),
-            "company": customer.get("company") or customer.get("Company") or "",
-            "phone": customer.get("phone") or customer.get("Phone"),
-            "fax": customer.get("fax") or customer.get("Fax") or "",
-            "vat_number": customer.get("vat_number") or customer.get("VatNumber") or "",
-            "vat_number_status": customer.get("vat_number_status_id") or customer.get("VatNumberStatusId"),
-            "timezone_id": customer.get("time_zone_id") or customer.get("TimeZoneId"),
-            "language_id": customer.get("language_id") or customer.get("LanguageId"),
-            "currency_id": customer.get("currency_id") or customer.get("CurrencyId"),
-            "is_active": customer.get("is_active") or customer.get("Active") or customer.get("IsActive"),
-            "deleted": customer.get("deleted") or customer.get("Deleted") or False,
-            "is_system_account": customer.get("is_system_account") or customer.get("IsSystemAccount") or False,
-            "system_name": customer.get("system_name") or customer.get("SystemName") or "",
-            "admin_comment": customer.get("admin_comment") or customer.get("AdminComment") or "",
-            "is_tax_exempt": customer.get("is_tax_exempt") or customer.get("IsTaxExempt") or False,
-            "affiliate_id": customer.get("affiliate_id") or customer.get("AffiliateId"),
-            "vendor_id": customer.get("vendor_id") or customer.get("VendorId"),
-            "registered_in_store_id": customer.get("registered_in_store_id") or customer.get("RegisteredInStoreId"),
-            "created_on": customer.get("created_on_utc") or customer.get("CreatedOnUtc"),
-            "last_activity_date": customer.get("last_activity_date_utc") or customer.get("LastActivityDateUtc"),
-            "last_login_date": customer.get("last_login_date_utc") or customer.get("LastLoginDateUtc"),
-            "last_ip_address": customer.get("last_ip_address") or customer.get("LastIpAddress") or "",
-            "billing_address": self._normalize_address(customer.get("billing_address") or customer.get("BillingAddress")),
-            "shipping_address": self._normalize_address(customer.get("shipping_address") or customer.get("ShippingAddress")),
-            "addresses": [self._normalize_address(a) for a in (customer.get("addresses") or customer.get("Addresses") or [])],
-            "customer_roles": customer.get("customer_roles") or customer.get("CustomerRoles") or customer.get("roles") or customer.get("Roles") or [],
-            "shopping_cart_items": customer.get("shopping_cart_items") or customer.get("ShoppingCartItems") or [],
-            "reward_points_balance": customer.get("reward_points_balance") or customer.get("RewardPointsBalance") or 0,
-            "has_orders": customer.get("has_orders") or customer.get("HasOrders") or False,
-            "order_count": customer.get("order_count") or customer.get("OrderCount") or 0,
-            "total_spent": customer.get("total_spent") or customer.get("TotalSpent") or 0,
-            "avatar_url": customer.get("avatar_url") or customer.get("AvatarUrl") or "",
-            "newsletter_subscribed": customer.get("newsletter_subscribed") or customer.get("NewsletterSubscribed") or False,
-            "custom_attributes": customer.get("custom_customer_attributes") or customer.get("CustomCustomerAttributes") or ""
-        }
-
-    def _normalize_address(self, address: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
-        """Normalize address data."""
-        if not address:
-            return None
-        return {
-            "id": address.get("id") or address.get("Id"),
-            "first_name": address.get("first_name") or address.get("FirstName") or "",
-            "last_name": address.get("last_name") or address.get("LastName") or "",
-            "email": address.get("email") or address.get("Email") or "",
-            "company": address.get("company") or address.get("Company") or "",
-            "country_id": address.get("country_id") or address.get("CountryId"),
-            "country": address.get("country") or address.get("Country") or "",
-            "state_province_id": address.get("state_province_id") or address.get("StateProvinceId"),
-            "state_province": address.get("state_province") or address.get("StateProvince") or "",
-            "county": address.get("county") or address.get("County") or "",
-            "city": address.get("city") or address.get("City") or "",
-            "address1": address.get("address1") or address.get("Address1") or "",
-            "address2": address.get("address2") or address.get("Address2") or "",
-            "zip_postal_code": address.get("zip_postal_code") or address.get("ZipPostalCode") or "",
-            "phone_number": address.get("phone_number") or address.get("PhoneNumber") or "",
-            "fax_number": address.get("fax_number") or address.get("FaxNumber") or "",
-            "custom_attributes": address.get("custom_attributes") or address.get("CustomAttributes") or "",
-            "created_on": address.get("created_on_utc") or address.get("CreatedOnUtc")
-        }
-
-    def _normalize_order(self, order: Dict[str, Any]) -> Dict[str, Any]:
-        """Normalize order data."""
-        return {
-            "id": order.get("id") or order.get("Id"),
-            "order_guid": order.get("order_guid") or order.get("OrderGuid"),
-            "order_number": order.get("custom_order_number") or order.get("order_number") or order.get("id") or order.get("Id"),
-            "store_id": order.get("store_id") or order.get("StoreId"),
-            "customer_id": order.get("customer_id") or order.get("CustomerId"),
-            "customer_email": order.get("customer_email") or order.get("CustomerEmail") or "",
-            "customer_name": order.get("customer_name") or order.get("CustomerName") or "",
-            "customer_ip": order.get("customer_ip") or order.get("CustomerIp") or "",
-            "order_status": order.get("order_status") or order.get("OrderStatus") or order.get("status") or order.get("Status") or "Unknown",
-            "order_status_id": order.get("order_status_id") or order.get("OrderStatusId"),
-            "payment_status": order.get("payment_status") or order.get("PaymentStatus"),
-            "payment_status_id": order.get("payment_status_id") or order.get("PaymentStatusId"),
-            "shipping_status": order.get("shipping_status") or order.get("ShippingStatus"),
-            "shipping_status_id": order.get("shipping_status_id") or order.get("ShippingStatusId"),
-            "payment_method": order.get("payment_method_system_name") or order.get("PaymentMethodSystemName") or "",
-            "card_type": order.get("card_type") or order.get("CardType") or "",
-            "card_name": order.get("card_name") or order.get("CardName") or "",
-            "card_number_masked": order.get("masked_credit_card_number") or order.get("MaskedCreditCardNumber") or "",
-            "authorization_transaction_id": order.get("authorization_transaction_id") or order.get("AuthorizationTransactionId") or "",
-            "capture_transaction_id": order.get("capture_transaction_id") or order.get("CaptureTransactionId") or "",
-            "paid_date": order.get("paid_date_utc") or order.get("PaidDateUtc"),
-            "shipping_method": order.get("shipping_method") or order.get("ShippingMethod") or "",
-            "shipping_rate_provider": order.get("shipping_rate_computation_method_system_name") or order.get("ShippingRateComputationMethodSystemName") or "",
-            "tracking_number": order.get("tracking_number") or order.get("TrackingNumber") or "",
-            "shipped_date": order.get("shipped_date_utc") or order.get("ShippedDateUtc"),
-            "delivery_date": order.get("delivery_date_utc") or order.get("DeliveryDateUtc"),
-            "pickup_in_store": order.get("pickup_in_store") or order.get("PickupInStore") or False,
-            "pickup_address": self._normalize_address(order.get("pickup_address") or order.get("PickupAddress")),
-            "order_subtotal": order.get("order_subtotal_incl_tax") or order.get("OrderSubtotalInclTax") or order.get("order_subtotal") or order.get("OrderSubtotal") or 0,
-            "order_subtotal_excl_tax": order.get("order_subtotal_excl_tax") or order.get("OrderSubtotalExclTax") or 0,
-            "order_subtotal_discount": order.get("order_sub_total_discount_incl_tax") or order.get("OrderSubTotalDiscountInclTax") or 0,
-            "order_shipping": order.get("order_shipping_incl_tax") or order.get("OrderShippingInclTax") or order.get("order_shipping") or order.get("OrderShipping") or 0,
-            "order_shipping_excl_tax": order.get("order_shipping_excl_tax") or order.get("OrderShippingExclTax") or 0,
-            "payment_method_additional_fee": order.get("payment_method_additional_fee_incl_tax") or order.get("PaymentMethodAdditionalFeeInclTax") or 0,
-            "order_tax": order.get("order_tax") or order.get("OrderTax") or 0,
-            "tax_rates": order.get("tax_rates") or order.get("TaxRates") or "",
-            "order_discount": order.get("order_discount") or order.get("OrderDiscount") or 0,
-            "total": order.get("order_total") or order.get("OrderTotal") or order.get("total") or 0,
-            "refunded_amount": order.get("refunded_amount") or order.get("RefundedAmount") or 0,
-            "reward_points_earned": order.get("reward_points_history_entry_id") or order.get("RewardPointsHistoryEntryId"),
-            "reward_points_used": order.get("redeemed_reward_points") or order.get("RedeemedRewardPoints") or 0,
-            "reward_points_value": order.get("redeemed_reward_points_amount") or order.get("RedeemedRewardPointsAmount") or 0,
-            "checkout_attribute_description": order.get("checkout_attribute_description") or order.get("CheckoutAttributeDescription") or "",
-            "customer_currency_code": order.get("customer_currency_code") or order.get("CustomerCurrencyCode") or "",
-            "currency_rate": order.get("currency_rate") or order.get("CurrencyRate") or 1,
-            "affiliate_id": order.get("affiliate_id") or order.get("AffiliateId"),
-            "customer_language_id": order.get("customer_language_id") or order.get("CustomerLanguageId"),
-            "customer_tax_display_type": order.get("customer_tax_display_type_id") or order.get("CustomerTaxDisplayTypeId"),
-            "vat_number": order.get("vat_number") or order.get("VatNumber") or "",
-            "billing_address": self._normalize_address(order.get("billing_address") or order.get("BillingAddress")),
-            "shipping_address": self._normalize_address(order.get("shipping_address") or order.get("ShippingAddress")),
-            "allow_storing_credit_card": order.get("allow_storing_credit_card_number") or order.get("AllowStoringCreditCardNumber") or False,
-            "deleted": order.get("deleted") or order.get("Deleted") or False,
-            "created_on": order.get("created_on") or order.get("CreatedOn") or order.get("created_on_utc") or order.get("CreatedOnUtc"),
-            "order_notes": order.get("order_notes") or order.get("OrderNotes") or [],
-            "items": [self._normalize_order_item(item) for item in (order.get("order_items") or order.get("OrderItems") or order.get("items") or [])],
-            "total_items": order.get("total_items") or order.get("TotalItems") or len(order.get("order_items") or order.get("OrderItems") or order.get("items") or []),
-            "shipments": order.get("shipments") or order.get("Shipments") or [],
-            "gift_cards": order.get("gift_card_usage_history") or order.get("GiftCardUsageHistory") or [],
-            "discount_codes": order.get("discount_usage_history") or order.get("DiscountUsageHistory") or []
-        }
-
-    def _normalize_order_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
-        """Normalize order item data."""
-        return {
-            "id": item.get("id") or item.get("Id"),
-            "order_item_guid": item.get("order_item_guid") or item.get("OrderItemGuid"),
-            "product_id": item.get("product_id") or item.get("ProductId"),
-            "product_name": item.get("product_name") or item.get("ProductName") or "",
-            "sku": item.get("sku") or item.get("Sku") or "",
-            "quantity": item.get("quantity") or item.get("Quantity") or 0,
-            "unit_price_incl_tax": item.get("unit_price_incl_tax") or item.get("UnitPriceInclTax") or 0,
-            "unit_price_excl_tax": item.get("unit_price_excl_tax") or item.get("UnitPriceExclTax") or 0,
-            "price_incl_tax": item.get("price_incl_tax") or item.get("PriceInclTax") or 0,
-            "price_excl_tax": item.get("price_excl_tax") or item.get("PriceExclTax") or 0,
-            "discount_amount_incl_tax": item.get("discount_amount_incl_tax") or item.get("DiscountAmountInclTax") or 0,
-            "discount_amount_excl_tax": item.get("discount_amount_excl_tax") or item.get("DiscountAmountExclTax") or 0,
-            "original_product_cost": item.get("original_product_cost") or item.get("OriginalProductCost") or 0,
-            "attribute_description": item.get("attribute_description") or item.get("AttributeDescription") or "",
-            "attributes_xml": item.get("attributes_xml") or item.get("AttributesXml") or "",
-            "download_count": item.get("download_count") or item.get("DownloadCount") or 0,
-            "is_download_activated": item.get("is_download_activated") or item.get("IsDownloadActivated") or False,
-            "license_download_id": item.get("license_download_id") or item.get("LicenseDownloadId"),
-            "rental_start_date": item.get("rental_start_date_utc") or item.get("RentalStartDateUtc"),
-            "rental_end_date": item.get("rental_end_date_utc") or item.get("RentalEndDateUtc"),
-            "item_weight": item.get("item_weight") or item.get("ItemWeight")
-        }
-
-    # =========================================================================
-    # ADMIN API
-    # =========================================================================
-
-    def admin_get_product(self, product_id: int) -> Dict[str, Any]:
-        """Get product details from Admin API."""
-        response = self._admin_request("GET", f"/api/admin/products/{product_id}")
-        if response and response.status_code == 200:
-            data = response.json()
-            product = data.get("product") or data.get("Product") or data
-            return {
-                "success": True,
-                "product": self._normalize_product(product),
-                "error": None
-            }
-        return {
-            "success": False,
-            "product": None,
-            "error": f"Product with ID {product_id} not found."
-        }
-
-    def admin_get_product_stock(self, product_id: int) -> Dict[str, Any]:
-        """Get product stock from Admin API."""
-        response = self._admin_request("GET", f"/api/admin/products/{product_id}/stock")
-        if response and response.status_code == 200:
-            data = response.json()
-            stock_quantity = data.get("stockQuantity") or data.get("stock_quantity") or data.get("StockQuantity") or 0
-            product_info = self.admin_get_product(product_id)
-            product_name = None
-            sku = None
-            if product_info.get("success"):
-                product = product_info.get("product") or {}
-                product_name = product.get("name")
-                sku = product.get("sku")
-            return {
-                "success": True,
-                "product_id": product_id,
-                "product_name": product_name,
-                "stock_quantity": stock_quantity,
-                "in_stock": int(stock_quantity) > 0,
-                "sku": sku,
-                "error": None
-            }
-        return {
-            "success": False,
-            "product_id": product_id,
-            "product_name": None,
-            "stock_quantity": 0,
-            "in_stock": False,
-            "sku": None,
-            "error": f"Failed to get stock for product {product_id}."
-        }
-
-    def admin_update_product_stock(self, product_id: int, quantity: int) -> Dict[str, Any]:
-        """Update product stock via Admin API."""
-        payload = {"stockQuantity": quantity}
-        response = self._admin_request("POST", f"/api/admin/products/{product_id}/stock", json=payload)
-        if response and response.status_code == 200:
-            return {
-                "success": True,
-                "product_id": product_id,
-                "new_quantity": quantity,
-                "error": None
-            }
-        return {
-            "success": False,
-            "product_id": product_id,
-            "new_quantity": None,
-            "error": f"Failed to update stock for product {product_id}."
-        }
-
-    def admin_get_order(self, order_id: int) -> Dict[str, Any]:
-        """Get order details from Admin API."""
-        response = self._admin_request("GET", f"/api/admin/orders/{order_id}")
-        if response and response.status_code == 200:
-            data = response.json()
-            order = data.get("order") or data.get("Order") or data
-            return {
-                "success": True,
-                "order": self._normalize_order(order),
-                "error": None
-            }
-        return {
-            "success": False,
-            "order": None,
-            "error": f"Order with ID {order_id} not found."
-        }
-
-    def admin_update_order_status(self, order_id: int, new_status: str) -> Dict[str, Any]:
-        """Update order status via Admin API."""
-        status_map = {
-            "pending": 10,
-            "processing": 20,
-            "complete": 30,
-            "completed": 30,
-            "cancelled": 40,
-            "canceled": 40,
-        }
-        status_id = None
-        if isinstance(new_status, int):
-            status_id = new_status
-        else:
-            text_status = str(new_status).strip()
-            if text_status.isdigit():
-                status_id = int(text_status)
-            else:
-                status_id = status_map.get(text_status.lower())
-
-        if status_id is None:
-            return {
-                "success": False,
-                "order_id": order_id,
-                "new_status": None,
-                "error": "Order status must be a valid status ID (e.g., 10, 20, 30, 40)."
-            }
-
-        payload = {"orderStatusId": status_id}
-        response = self._admin_request("POST", f"/api/admin/orders/{order_id}/status", json=payload)
-        if response and response.status_code == 200:
-            return {
-                "success": True,
-                "order_id": order_id,
-                "new_status": status_id,
-                "error": None
-            }
-        return {
-            "success": False,
-            "order_id": order_id,
-            "new_status": None,
-            "error": f"Failed to update status for order {order_id}."
-        }
-
-    def admin_get_order_invoice_pdf(self, order_id: int) -> Dict[str, Any]:
-        """Get order invoice from Admin API."""
-        response = self._admin_request("GET", f"/api/admin/orders/{order_id}/invoice", headers={"Accept": "application/pdf"})
-        if response and response.status_code == 200:
-            content_type = response.headers.get("Content-Type", "")
-            if "pdf" in content_type.lower() or response.content[:4] == b"%PDF":
-                pdf_base64 = base64.b64encode(response.content).decode("utf-8")
-                return {
-                    "success": True,
-                    "pdf_data": pdf_base64,
-                    "filename": f"invoice_order_{order_id}.pdf",
-                    "error": None
-                }
-            try:
-                data = response.json()
-                pdf_data = data.get("pdf") or data.get("pdf_data")
-                if pdf_data:
-                    return {
-                        "success": True,
-                        "pdf_data": pdf_data,
-                        "filename": data.get("filename") or f"invoice_order_{order_id}.pdf",
-                        "error": None
-                    }
-            except Exception:
-                pass
-        return {
-            "success": False,
-            "pdf_data": None,
-            "filename": None,
-            "error": f"Failed to retrieve invoice for order {order_id}."
-        }
-
-    def admin_get_customer(self, customer_id: int) -> Dict[str, Any]:
-        """Get customer by ID from Admin API."""
-        response = self._admin_request("GET", f"/api/admin/customers/{customer_id}")
-        if response and response.status_code == 200:
-            data = response.json()
-            customer = data.get("customer") or data.get("Customer") or data
-            return {
-                "success": True,
-                "customer": self._normalize_customer(customer),
-                "error": None
-            }
-        return {
-            "success": False,
-            "customer": None,
-            "error": f"Customer with ID {customer_id} not found."
-        }
-
-    def admin_get_customer_details(self, customer_id: int) -> Dict[str, Any]:
-        """Get customer details from Admin API."""
-        response = self._admin_request("GET", f"/api/admin/customers/{customer_id}/details")
-        if response and response.status_code == 200:
-            data = response.json()
-            customer = data.get("customer") or data.get("Customer") or data
-            return {
-                "success": True,
-                "customer": self._normalize_customer(customer),
-                "details": data,
-                "error": None
-            }
-        return {
-            "success": False,
-            "customer": None,
-            "details": None,
-            "error": f"Customer details not found for ID {customer_id}."
-        }
-
-    def admin_find_product(self, identifier: str) -> Dict[str, Any]:
-        """Find product by identifier (SKU or name) via Admin API."""
-        response = self._admin_request("GET", f"/api/admin/products/find/{identifier}")
-        if response and response.status_code == 200:
-            data = response.json()
-            
-            # Check explicit 'found' flag if present
-            if "found" in data and not data["found"]:
-                 return {
-                    "success": False,
-                    "product": None,
-                    "error": f"Product not found for identifier '{identifier}'."
-                }
-
-            # Try to get product(s) from response
-            product = None
-            products = data.get("products") or data.get("Products")
-            
-            if products:
-                # If list, take first item
-                if isinstance(products, list) and len(products) > 0:
-                    product = products[0]
-                elif isinstance(products, dict):
-                    product = products
-            else:
-                 # Fallback: check for single 'product' key or use data itself if it looks like a product
-                 product = data.get("product") or data.get("Product") or data
-
-            if product:
-                return {
-                    "success": True,
-                    "product": self._normalize_product(product),
-                    "error": None
-                }
-        
-        return {
-            "success": False,
-            "product": None,
-            "error": f"Product not found for identifier '{identifier}'."
-        }
-
-    def admin_find_customer(self, query: str) -> Dict[str, Any]:
-        """Find customers by query string via Admin API."""
-        response = self._admin_request("GET", f"/api/admin/customers/find/{query}")
-        if response and response.status_code == 200:
-            data = response.json()
-            customers = data.get("customers") or data.get("Customers") or data
-            if isinstance(customers, dict):
-                customers = customers.get("items") or customers.get("Items") or [customers]
-            if not isinstance(customers, list):
-                customers = [customers] if customers else []
-            return {
-                "success": True,
-                "customers": [self._normalize_customer(c) for c in customers],
-                "error": None
-            }
-        return {
-            "success": False,
-            "customers": [],
-            "error": f"No customers found for '{query}'."
-        }
-
-    def admin_get_customer_last_orders(self, query: str, limit: int = 5) -> Dict[str, Any]:
-        """Get last N orders for a customer (by id or query) via Admin API."""
-        response = self._admin_request("GET", f"/api/admin/customers/{query}/orders/last/{limit}")
-        if response and response.status_code == 200:
-            data = response.json()
-            orders = data.get("orders") or data.get("Orders") or data
-            if isinstance(orders, dict):
-                orders = orders.get("items") or orders.get("Items") or [orders]
-            if not isinstance(orders, list):
-                orders = [orders] if orders else []
-            return {
-                "success": True,
-                "orders": [self._normalize_order(o) for o in orders],
-                "error": None
-            }
-        return {
-            "success": False,
-            "orders": [],
-            "error": f"No recent orders found for '{query}'."
-        }
-
-    def admin_get_token_me(self) -> Dict[str, Any]:
-        """Get current admin token profile info via Admin API."""
-        if not self.access_token:
-            return {
-                "success": False,
-                "profile": None,
-                "error": "No admin token available."
-            }
-
-        url = f"{self._get_admin_base_url()}/api/admin/token/me"
-        headers = self._get_admin_headers()
-        try:
-            response = requests.get(url, headers=headers, timeout=15, verify=self.verify_ssl)
-            if response.status_code == 200:
-                data = response.json()
-                return {
-                    "success": True,
-                    "profile": data,
-                    "error": None
-                }
-            return {
-                "success": False,
-                "profile": None,
-                "error": f"Failed to retrieve admin token profile (status {response.status_code})."
-            }
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Admin token/me request failed: {e}")
-            return {
-                "success": False,
-                "profile": None,
-                "error": f"Connection error: {str(e)}"
-            }
-
-    def admin_get_me(self) -> Dict[str, Any]:
-        """Get current admin user info via Admin API."""
-        # Ensure we have a valid admin token first
-        if not self._ensure_admin_token():
-            return {
-                "success": False,
-                "profile": None,
-                "error": "Could not authenticate with admin API."
-            }
-        
-        # Use stored profile from login response if available
-        if hasattr(self, 'admin_profile') and self.admin_profile:
-            return {
-                "success": True,
-                "profile": self.admin_profile,
-                "error": None
-            }
-
-        # Fallback: try the /api/admin/me endpoint
-        url = f"{self._get_admin_base_url()}/api/admin/me"
-        headers = self._get_admin_headers()
-        try:
-            response = requests.get(url, headers=headers, timeout=15, verify=self.verify_ssl)
-            if response.status_code == 200:
-                data = response.json()
-                return {
-                    "success": True,
-                    "profile": data,
-                    "error": None
-                }
-            return {
-                "success": False,
-                "profile": None,
-                "error": f"Failed to retrieve admin profile (status {response.status_code})."
-            }
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Admin /me request failed: {e}")
-            return {
-                "success": False,
-                "profile": None,
-                "error": f"Connection error: {str(e)}"
-            }
-    
-    # =========================================================================
-    # PRODUCTS
-    # =========================================================================
-    
-    def search_products(
-        self,
-        query: str = None,
-        category_id: int = None,
-        page: int = 1,
-        limit: int = 10
-    ) -> Dict[str, Any]:
-        """
-        Search for products via Admin API find endpoint.
-
-        Args:
-            query: Search keyword
-            category_id: Filter by category ID
-            page: Page number for pagination
-            limit: Number of results per page
-
-        Returns:
-            Dict with 'success', 'products', 'total_count', 'error'
-        """
-        if not query:
-            return {
-                "success": False,
-                "products": [],
-                "total_count": 0,
-                "error": "No search query provided."
-            }
-
-        # Use admin find endpoint: /api/admin/products/find/{query} (partial match on ID/SKU/name)
-        response = self._admin_request("GET", f"/api/admin/products/find/{query}")
-        if response and response.status_code == 200:
-            try:
-                data = response.json()
-
-                # Handle both single product and list responses
-                products = (
-                    data.get("products") or data.get("Products") or
-                    data.get("product") or data.get("Product") or
-                    data
-                )
-                if isinstance(products, dict):
-                    items = products.get("items") or products.get("Items")
-                    products = items if items else [products]
-                if not isinstance(products, list):
-                    products = [products] if products else []
-
-                normalized_products = []
-                for p in products[:limit]:
-                    normalized_products.append({
-                        "id": p.get("id") or p.get("Id"),
-                        "name": p.get("name") or p.get("Name"),
-                        "short_description": p.get("short_description") or p.get("ShortDescription") or "",
-                        "price": p.get("price") or p.get("Price") or 0,
-                        "stock_quantity": p.get("stock_quantity") or p.get("StockQuantity") or 0,
-                        "in_stock": (p.get("stock_quantity") or p.get("StockQuantity") or 0) > 0,
-                        "image_url": self._get_product_image(p)
-                    })
-
-                return {
-                    "success": True,
-                    "products": normalized_products,
-                    "total_count": data.get("total_count") or len(normalized_products),
-                    "error": None
-                }
-            except Exception as e:
-                logger.error(f"Admin product find returned 200 but failed to parse: {e}")
-                return {
-                    "success": False,
-                    "products": [],
-                    "total_count": 0,
-                    "error": f"Failed to parse product search response: {e}"
-                }
-
-        # Log the failure
-        if response:
-            logger.error(f"Admin product find returned status {response.status_code} for query '{query}'")
-            error_msg = f"Product search failed with status {response.status_code}"
-        else:
-            logger.error(f"Admin product find request failed for query '{query}' (no response)")
-            error_msg = "Failed to connect to product search API."
-
-        return {
-            "success": False,
-            "products": [],
-            "total_count": 0,
-            "error": error_msg
-        }
-    
-    def _get_product_image(self, product: Dict) -> Optional[str]:
-        """Extract product image URL from various response formats."""
-        images = product.get("images") or product.get("Images") or []
-        if images and len(images) > 0:
-            img = images[0]
-            return img.get("src") or img.get("Src") or img.get("url") or img.get("Url")
-        
-        # Try direct image fields
-        return (
-            product.get("image_url") or 
-            product.get("ImageUrl") or 
-            product.get("default_picture_url")
-        )
-    
-    def get_product_details(self, product_id: int) -> Dict[str, Any]:
-        """
-        Get detailed information about a product.
-        
-        Args:
-            product_id: The product ID
-            
-        Returns:
-            Dict with 'success', 'product', 'error'
-        """
-        admin_result = self.admin_get_product(product_id)
-        if admin_result.get("success"):
-            return admin_result
-        endpoints = [
-            f"/products/{product_id}",
-            f"/api/products/{product_id}",
-            f"/api/PublicCatalog/Product/{product_id}"
-        ]
-        
-        for endpoint in endpoints:
-            try:
-                url = f"{self._get_public_base_url()}{endpoint}"
-                headers = self._get_auth_headers()
-                response = requests.get(url, headers=headers, timeout=10, verify=self.verify_ssl)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    product = data.get("product") or data.get("Product") or data
-                    
-                    return {
-                        "success": True,
-                        "product": self._normalize_product(product),
-                        "error": None
-                    }
-                    
-            except requests.exceptions.RequestException as e:
-                logger.debug(f"Get product at {endpoint} failed: {e}")
-                continue
-        
-        return {
-            "success": False,
-            "product": None,
-            "error": f"Product with ID {product_id} not found."
-        }
-    
-    def get_product_stock(self, product_id: int) -> Dict[str, Any]:
-        """
-        Get stock information for a product.
-        
-        Args:
-            product_id: The product ID
-            
-        Returns:
-            Dict with 'success', 'stock_quantity', 'in_stock', 'error'
-        """
-        admin_result = self.admin_get_product_stock(product_id)
-        if admin_result.get("success"):
-            return admin_result
-        result = self.get_product_details(product_id)
-        
-        if result["success"]:
-            product = result["product"]
-            return {
-                "success": True,
-                "product_id": product_id,
-                "product_name": product.get("name"),
-                "stock_quantity": product.get("stock_quantity", 0),
-                "in_stock": product.get("in_stock", False),
-                "sku": product.get("sku"),
-                "error": None
-            }
-        
-        return {
-            "success": False,
-            "product_id": product_id,
-            "product_name": None,
-            "stock_quantity": 0,
-            "in_stock": False,
-            "sku": None,
-            "error": result.get("error", "Failed to get stock information.")
-        }
-    
-    def update_product_stock(self, product_id: int, quantity: int) -> Dict[str, Any]:
-        """
-        Update stock quantity for a product.
-        
-        Args:
-            product_id: The product ID
-            quantity: New stock quantity
-            
-        Returns:
-            Dict with 'success', 'new_quantity', 'error'
-        """
-        admin_result = self.admin_update_product_stock(product_id, quantity)
-        if admin_result.get("success"):
-            return admin_result
-        endpoints = [
-            f"/products/{product_id}",
-            f"/api/products/{product_id}",
-        ]
-        
-        payload = {
-            "product": {
-                "id": product_id,
-                "stock_quantity": quantity,
-                "StockQuantity": quantity
-            }
-        }
-        
-        for endpoint in endpoints:
-            try:
-                url = f"{self.api_url}{endpoint}"
-                headers = self._get_auth_headers()
-                response = requests.put(url, headers=headers, json=payload, timeout=10)
-                
-                if response.status_code in [200, 204]:
-                    logger.info(f"Updated stock for product {product_id} to {quantity}")
-                    return {
-                        "success": True,
-                        "product_id": product_id,
-                        "new_quantity": quantity,
-                        "error": None
-                    }
-                    
-            except requests.exceptions.RequestException as e:
-                logger.debug(f"Update stock at {endpoint} failed: {e}")
-                continue
-        
-        return {
-            "success": False,
-            "product_id": product_id,
-            "new_quantity": None,
-            "error": "Failed to update stock. You may not have permission for this action."
-        }
-    
-    # =========================================================================
-    # ORDERS
-    # =========================================================================
-    
-    def get_customer_orders(
-        self, 
-        customer_id: int = None, 
-        status: str = None,
-        page: int = 1,
-        limit: int = 10
-    ) -> Dict[str, Any]:
-        """
-        Get orders for a customer.
-        
-        Args:
-            customer_id: The customer ID (if None, uses current logged-in customer)
-            status: Filter by order status
-            page: Page number
-            limit: Number of results per page
-            
-        Returns:
-            Dict with 'success', 'orders', 'total_count', 'error'
-        """
-        params = {
-            "page": page,
-            "limit": limit
-        }
-        
-        if customer_id:
-            params["customer_id"] = customer_id
-        
-        if status:
-            params["status"] = status
-        
-        endpoints = [
-            "/orders",
-            "/api/orders",
-            "/api/PublicOrder/CustomerOrders"
-        ]
-        
-        for endpoint in endpoints:
-            try:
-                url = f"{self.api_url}{endpoint}"
-                headers = self._get_auth_headers()
-                response = requests.get(url, headers=headers, params=params, timeout=15, verify=self.verify_ssl)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    orders = data.get("orders") or data.get("Orders") or data
-                    
-                    if isinstance(orders, dict):
-                        orders = orders.get("items") or [orders]
-                    
-                    if not isinstance(orders, list):
-                        orders = [orders] if orders else []
-                    
-                    # Normalize order data
-                    normalized_orders = []
-                    for o in orders[:limit]:
-                        normalized_orders.append({
-                            "id": o.get("id") or o.get("Id"),
-                            "order_number": o.get("custom_order_number") or o.get("CustomOrderNumber") or o.get("id"),
-                            "order_status": o.get("order_status") or o.get("OrderStatus") or "Unknown",
-                            "total": o.get("order_total") or o.get("OrderTotal") or 0,
-                            "created_on": o.get("created_on_utc") or o.get("CreatedOnUtc"),
-                            "payment_status": o.get("payment_status") or o.get("PaymentStatus"),
-                            "shipping_status": o.get("shipping_status") or o.get("ShippingStatus"),
-                        })
-                    
-                    return {
-                        "success": True,
-                        "orders": normalized_orders,
-                        "total_count": data.get("total_count") or len(normalized_orders),
-                        "error": None
-                    }
-                    
-            except requests.exceptions.RequestException as e:
-                logger.debug(f"Get orders at {endpoint} failed: {e}")
-                continue
-        
-        return {
-            "success": False,
-            "orders": [],
-            "total_count": 0,
-            "error": "Failed to retrieve orders."
-        }
-    
-    def get_order_details(self, order_id: int) -> Dict[str, Any]:
-        """
-        Get detailed information about an order.
-        
-        Args:
-            order_id: The order ID
-            
-        Returns:
-            Dict with 'success', 'order', 'error'
-        """
-        admin_result = self.admin_get_order(order_id)
-        if admin_result.get("success"):
-            order = admin_result.get("order") or {}
-            return {
-                "success": True,
-                "order": {
-                    "id": order.get("id"),
-                    "order_number": order.get("order_number"),
-                    "order_status": order.get("order_status"),
-                    "payment_status": order.get("payment_status"),
-                    "shipping_status": order.get("shipping_status"),
-                    "total": order.get("total"),
-                    "subtotal": order.get("subtotal"),
-                    "shipping_cost": order.get("shipping_cost"),
-                    "tax": order.get("tax"),
-                    "created_on": order.get("created_on"),
-                    "items": order.get("items") or [],
-                    "total_items": order.get("total_items"),
-                    "shipping_address": order.get("shipping_address"),
-                    "billing_address": order.get("billing_address"),
-                },
-                "error": None
-            }
-        endpoints = [
-            f"/orders/{order_id}",
-            f"/api/orders/{order_id}",
-            f"/api/PublicOrder/OrderDetails/{order_id}"
-        ]
-        
-        for endpoint in endpoints:
-            try:
-                url = f"{self.api_url}{endpoint}"
-                headers = self._get_auth_headers()
-                response = requests.get(url, headers=headers, timeout=10, verify=self.verify_ssl)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    order = data.get("order") or data.get("Order") or data
-                    
-                    # Get order items
-                    items = order.get("order_items") or order.get("OrderItems") or []
-                    normalized_items = []
-                    for item in items:
-                        normalized_items.append({
-                            "product_id": item.get("product_id") or item.get("ProductId"),
-                            "product_name": item.get("product_name") or item.get("ProductName") or "Unknown Product",
-                            "quantity": item.get("quantity") or item.get("Quantity") or 1,
-                            "unit_price": item.get("unit_price_incl_tax") or item.get("UnitPriceInclTax") or 0,
-                            "total": item.get("price_incl_tax") or item.get("PriceInclTax") or 0,
-                        })
-                    
-                    return {
-                        "success": True,
-                        "order": {
-                            "id": order.get("id") or order.get("Id"),
-                            "order_number": order.get("custom_order_number") or order.get("id"),
-                            "order_status": order.get("order_status") or order.get("OrderStatus") or "Unknown",
-                            "payment_status": order.get("payment_status") or order.get("PaymentStatus"),
-                            "shipping_status": order.get("shipping_status") or order.get("ShippingStatus"),
-                            "total": order.get("order_total") or order.get("OrderTotal") or 0,
-                            "subtotal": order.get("order_subtotal_incl_tax") or order.get("OrderSubtotalInclTax") or 0,
-                            "shipping_cost": order.get("order_shipping_incl_tax") or order.get("OrderShippingInclTax") or 0,
-                            "tax": order.get("order_tax") or order.get("OrderTax") or 0,
-                            "created_on": order.get("created_on_utc") or order.get("CreatedOnUtc"),
-                            "items": normalized_items,
-                            "total_items": order.get("total_items") or order.get("TotalItems"),
-                            "shipping_address": order.get("shipping_address") or order.get("ShippingAddress"),
-                            "billing_address": order.get("billing_address") or order.get("BillingAddress"),
-                        },
-                        "error": None
-                    }
-                    
-            except requests.exceptions.RequestException as e:
-                logger.debug(f"Get order at {endpoint} failed: {e}")
-                continue
-        
-        return {
-            "success": False,
-            "order": None,
-            "error": f"Order with ID {order_id} not found."
-        }
-    
-    def track_order(self, order_id: int) -> Dict[str, Any]:
-        """
-        Get tracking information for an order.
-        
-        Args:
-            order_id: The order ID
-            
-        Returns:
-            Dict with 'success', 'tracking', 'error'
-        """
-        result = self.get_order_details(order_id)
-        
-        if result["success"]:
-            order = result["order"]
-            
-            # Determine tracking status message
-            status = order.get("order_status", "Unknown")
-            shipping_status = order.get("shipping_status", "Unknown")
-            payment_status = order.get("payment_status", "Unknown")
-            
-            status_messages = {
-                "Pending": "Your order is being processed.",
-                "Processing": "Your order is being prepared for shipment.",
-                "Complete": "Your order has been delivered.",
-                "Cancelled": "This order has been cancelled.",
-                "NotYetShipped": "Your order is waiting to be shipped.",
-                "Shipped": "Your order is on its way!",
-                "Delivered": "Your order has been delivered.",
-                "PartiallyShipped": "Part of your order has been shipped."
-            }
-            
-            tracking_message = status_messages.get(
-                shipping_status, 
-                status_messages.get(status, "Order status is being updated.")
-            )
-            
-            return {
-                "success": True,
-                "tracking": {
-                    "order_id": order_id,
-                    "order_number": order.get("order_number"),
-                    "order_status": status,
-                    "shipping_status": shipping_status,
-                    "payment_status": payment_status,
-                    "message": tracking_message,
-                    "total": order.get("total"),
-                    "created_on": order.get("created_on"),
-                    "items_count": len(order.get("items", [])),
-                    "total_items": order.get("total_items", 0)
-                },
-                "error": None
-            }
-        
-        return {
-            "success": False,
-            "tracking": None,
-            "error": result.get("error", "Failed to track order.")
-        }
-    
-    def get_order_invoice_pdf(self, order_id: int) -> Dict[str, Any]:
-        """
-        Get PDF invoice for an order.
-        
-        Args:
-            order_id: The order ID
-            
-        Returns:
-            Dict with 'success', 'pdf_data' (base64), 'filename', 'error'
-        """
-        admin_result = self.admin_get_order_invoice_pdf(order_id)
-        if admin_result.get("success"):
-            return admin_result
-        endpoints = [
-            f"/orders/{order_id}/pdf",
-            f"/api/orders/{order_id}/pdf",
-            f"/api/PublicOrder/GetPdfInvoice/{order_id}"
-        ]
-        
-        for endpoint in endpoints:
-            try:
-                url = f"{self.api_url}{endpoint}"
-                headers = self._get_auth_headers()
-                headers["Accept"] = "application/pdf"
-                response = requests.get(url, headers=headers, timeout=30, verify=self.verify_ssl)
-                
-                if response.status_code == 200:
-                    # Check if response is PDF
-                    content_type = response.headers.get("Content-Type", "")
-                    
-                    if "pdf" in content_type.lower() or response.content[:4] == b'%PDF':
-                        pdf_base64 = base64.b64encode(response.content).decode('utf-8')
-                        return {
-                            "success": True,
-                            "pdf_data": pdf_base64,
-                            "filename": f"invoice_order_{order_id}.pdf",
-                            "error": None
-                        }
-                    
-            except requests.exceptions.RequestException as e:
-                logger.debug(f"Get invoice at {endpoint} failed: {e}")
-                continue
-        
-        return {
-            "success": False,
-            "pdf_data": None,
-            "filename": None,
-            "error": f"Failed to generate invoice for order {order_id}."
-        }
-    
-    def update_order_status(self, order_id: int, new_status: str) -> Dict[str, Any]:
-        """
-        Update the status of an order.
-        
-        Args:
-            order_id: The order ID
-            new_status: New order status (e.g., 'Processing', 'Complete', 'Cancelled')
-            
-        Returns:
-            Dict with 'success', 'new_status', 'error'
-        """
-        admin_result = self.admin_update_order_status(order_id, new_status)
-        if admin_result.get("success"):
-            return admin_result
-        # Map status names to nopCommerce status values
-        status_map = {
-            "pending": "Pending",
-            "processing": "Processing",
-            "complete": "Complete",
-            "completed": "Complete",
-            "cancelled": "Cancelled",
-            "canceled": "Cancelled",
-        }
-        
-        normalized_status = status_map.get(new_status.lower(), new_status)
-        
-        endpoints = [
-            f"/orders/{order_id}",
-            f"/api/orders/{order_id}",
-        ]
-        
-        payload = {
-            "order": {
-                "id": order_id,
-                "order_status": normalized_status,
-                "OrderStatus": normalized_status
-            }
-        }
-        
-        for endpoint in endpoints:
-            try:
-                url = f"{self.api_url}{endpoint}"
-                headers = self._get_auth_headers()
-                response = requests.put(url, headers=headers, json=payload, timeout=10)
-                
-                if response.status_code in [200, 204]:
-                    logger.info(f"Updated order {order_id} status to {normalized_status}")
-                    return {
-                        "success": True,
-                        "order_id": order_id,
-                        "new_status": normalized_status,
-                        "error": None
-                    }
-                    
-            except requests.exceptions.RequestException as e:
-                logger.debug(f"Update order status at {endpoint} failed: {e}")
-                continue
-        
-        return {
-            "success": False,
-            "order_id": order_id,
-            "new_status": None,
-            "error": "Failed to update order status. You may not have permission for this action."
-        }
-    
-    # =========================================================================
-    # CATEGORIES (Helper)
-    # =========================================================================
-    
-    def get_categories(self, parent_id: int = None) -> Dict[str, Any]:
-        """
-        Get product categories.
-        
-        Args:
-            parent_id: Filter by parent category ID
-            
-        Returns:
-            Dict with 'success', 'categories', 'error'
-        """
-        params = {}
-        if parent_id:
-            params["parent_category_id"] = parent_id
-        
-        endpoints = [
-            "/categories",
-            "/api/categories",
-            "/api/PublicCatalog/Categories"
-        ]
-        
-        for endpoint in endpoints:
-            try:
-                url = f"{self.api_url}{endpoint}"
-                headers = self._get_auth_headers()
-                response = requests.get(url, headers=headers, params=params, timeout=10, verify=self.verify_ssl)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    categories = data.get("categories") or data.get("Categories") or data
-                    
-                    if not isinstance(categories, list):
-                        categories = [categories] if categories else []
-                    
-                    normalized_cats = []
-                    for c in categories:
-                        normalized_cats.append({
-                            "id": c.get("id") or c.get("Id"),
-                            "name": c.get("name") or c.get("Name"),
-                            "parent_id": c.get("parent_category_id") or c.get("ParentCategoryId"),
-                        })
-                    
-                    return {
-                        "success": True,
-                        "categories": normalized_cats,
-                        "error": None
-                    }
-                    
-            except requests.exceptions.RequestException as e:
-                logger.debug(f"Get categories at {endpoint} failed: {e}")
-                continue
-        
-        return {
-            "success": False,
-            "categories": [],
-            "error": "Failed to retrieve categories."
-        }
+"""
+nopCommerce API Service Module
+Handles all API interactions with nopCommerce v4.9
+"""
+
+import logging
+import requests
+import base64
+import json
+import ssl
+import time
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from types import MappingProxyType
+from typing import Dict, Any, Iterator, Optional, List, Tuple
+from datetime import datetime, timedelta
+
+logger = logging.getLogger(__name__)
+
+# Shared pool for cold-start endpoint probing; sized for one probe burst
+# (3 endpoints) from a couple of concurrent conversations.
+_PROBE_POOL = ThreadPoolExecutor(max_workers=8)
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json remains the fallback
+    orjson = None
+
+
+def _parse_json(response: requests.Response) -> Any:
+    """Decode a response body, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _dump_json(payload: Any) -> bytes:
+    """Serialize a request body to bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+class _SSLContextAdapter(HTTPAdapter):
+    """HTTPAdapter that reuses one SSLContext across all pooled connections.
+
+    Sharing the context means the CA bundle is loaded once and TLS session
+    caches are shared between pools instead of re-created per adapter.
+    """
+
+    def __init__(self, ssl_context: Optional[ssl.SSLContext] = None, **kwargs):
+        self._ssl_context = ssl_context
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self._ssl_context is not None:
+            kwargs["ssl_context"] = self._ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+
+
+def _as_list(value: Any, inner_key: str = "items") -> List[Any]:
+    """Coerce an API response payload (list, dict, scalar or None) to a list."""
+    if isinstance(value, list):
+        return value
+    if isinstance(value, dict):
+        return value.get(inner_key) or [value]
+    return [value] if value else []
+
+
+def _first(d: Dict[str, Any], keys: Tuple[str, ...], default: Any = None) -> Any:
+    """Return the first truthy value among *keys*, mirroring ``a or b or default``."""
+    get = d.get
+    for k in keys:
+        v = get(k)
+        if v:
+            return v
+    return default() if callable(default) else default
+
+
+def _apply_aliases(d: Dict[str, Any], fields: Tuple[Tuple[str, Tuple[str, ...], Any], ...]) -> Dict[str, Any]:
+    """Build a canonical dict from *d* driven by a (canonical, aliases, default) table.
+
+    Replaces the old per-field ``d.get(a) or d.get(b) or default`` chains with
+    one tight loop over a precompiled table — the same falsy-fallthrough
+    semantics, far fewer dict lookups per record. Callable defaults (e.g.
+    ``list``) are invoked so records never share a mutable default.
+    """
+    get = d.get
+    out = {}
+    for canon, keys, default in fields:
+        for k in keys:
+            v = get(k)
+            if v:
+                break
+        else:
+            v = default() if callable(default) else default
+        out[canon] = v
+    return out
+
+
+# Login body shape per known auth plugin endpoint — once we know which plugin
+# is running there is no point shipping every naming convention in one payload.
+_LOGIN_PAYLOAD_SHAPES = {
+    "/token": lambda u, p: {"username": u, "password": p, "grant_type": "password"},
+    "/api-backend/Authenticate/GetToken": lambda u, p: {"username": u, "password": p},
+    "/api/PublicCustomer/Login": lambda u, p: {"UsernameOrEmail": u, "Password": p},
+}
+
+
+def _login_payload(endpoint: str, username: str, password: str) -> Dict[str, str]:
+    """Build the login body for *endpoint*, falling back to the superset shape."""
+    shape = _LOGIN_PAYLOAD_SHAPES.get(endpoint)
+    if shape is not None:
+        return shape(username, password)
+    return {
+        "username": username,
+        "email": username,
+        "UsernameOrEmail": username,
+        "password": password,
+        "Password": password,
+        "grant_type": "password"
+    }
+
+
+# nopCommerce order status names -> OrderStatusId, frozen so it is built once.
+_ORDER_STATUS_MAP = MappingProxyType({
+    "pending": 10,
+    "processing": 20,
+    "complete": 30,
+    "completed": 30,
+    "cancelled": 40,
+    "canceled": 40,
+})
+
+# Customer-facing messages per shipping/order status, shared across instances.
+_STATUS_MESSAGES = MappingProxyType({
+    "Pending": "Your order is being processed.",
+    "Processing": "Your order is being prepared for shipment.",
+    "Complete": "Your order has been delivered.",
+    "Cancelled": "This order has been cancelled.",
+    "NotYetShipped": "Your order is waiting to be shipped.",
+    "Shipped": "Your order is on its way!",
+    "Delivered": "Your order has been delivered.",
+    "PartiallyShipped": "Part of your order has been shipped."
+})
+
+# Loose status names -> canonical nopCommerce status names (public API).
+_STATUS_NAME_MAP = MappingProxyType({
+    "pending": "Pending",
+    "processing": "Processing",
+    "complete": "Complete",
+    "completed": "Complete",
+    "cancelled": "Cancelled",
+    "canceled": "Cancelled",
+})
+
+# Alias tables for the normalizers below. Each entry is
+# (canonical_key, (accepted API spellings...), default).
+_PRODUCT_FIELDS = (
+    ("id", ("id", "Id"), None),
+    ("name", ("name", "Name"), None),
+    ("short_description", ("short_description", "ShortDescription"), ""),
+    ("full_description", ("full_description", "FullDescription"), ""),
+    ("sku", ("sku", "Sku"), ""),
+    ("gtin", ("gtin", "Gtin"), ""),
+    ("manufacturer_part_number", ("manufacturer_part_number", "ManufacturerPartNumber"), ""),
+    ("price", ("price", "Price"), 0),
+    ("min_price", ("min_price", "MinPrice"), None),
+    ("price_a", ("price_a", "TierPriceA"), None),
+    ("price_b", ("price_b", "TierPriceB"), None),
+    ("price_c", ("price_c", "TierPriceC"), None),
+    ("old_price", ("old_price", "OldPrice"), None),
+    ("special_price", ("special_price", "SpecialPrice"), None),
+    ("discount_amount", ("discount_amount", "DiscountAmount"), None),
+    ("cost", ("product_cost", "ProductCost"), None),
+    ("stock_quantity", ("stock_quantity", "StockQuantity"), 0),
+    ("available_start_date", ("available_start_date_time_utc", "AvailableStartDateTimeUtc"), None),
+    ("available_end_date", ("available_end_date_time_utc", "AvailableEndDateTimeUtc"), None),
+    ("warehouse_id", ("warehouse_id", "WarehouseId"), None),
+    ("min_stock_quantity", ("min_stock_quantity", "MinStockQuantity"), 0),
+    ("notify_low_stock", ("notify_admin_for_quantity_below", "NotifyAdminForQuantityBelow"), None),
+    ("manage_inventory", ("manage_inventory_method", "ManageInventoryMethod"), None),
+    ("allow_back_in_stock", ("allow_back_in_stock_subscriptions", "AllowBackInStockSubscriptions"), None),
+    ("weight", ("weight", "Weight"), 0),
+    ("length", ("length", "Length"), 0),
+    ("width", ("width", "Width"), 0),
+    ("height", ("height", "Height"), 0),
+    ("is_free_shipping", ("is_free_shipping", "IsFreeShipping"), False),
+    ("additional_shipping_charge", ("additional_shipping_charge", "AdditionalShippingCharge"), 0),
+    ("is_tax_exempt", ("is_tax_exempt", "IsTaxExempt"), False),
+    ("tax_category_id", ("tax_category_id", "TaxCategoryId"), None),
+    ("published", ("published", "Published"), False),
+    ("deleted", ("deleted", "Deleted"), False),
+    ("created_on", ("created_on_utc", "CreatedOnUtc"), None),
+    ("updated_on", ("updated_on_utc", "UpdatedOnUtc"), None),
+    ("product_type", ("product_type", "ProductType", "product_type_id", "ProductTypeId"), None),
+    ("vendor_id", ("vendor_id", "VendorId"), None),
+    ("vendor_name", ("vendor_name", "VendorName"), ""),
+    ("manufacturer_id", ("manufacturer_id", "ManufacturerId"), None),
+    ("manufacturer_name", ("manufacturer_name", "ManufacturerName"), ""),
+    ("approved_rating_sum", ("approved_rating_sum", "ApprovedRatingSum"), 0),
+    ("approved_total_reviews", ("approved_total_reviews", "ApprovedTotalReviews"), 0),
+    ("display_order", ("display_order", "DisplayOrder"), 0),
+    ("order_minimum_quantity", ("order_minimum_quantity", "OrderMinimumQuantity"), 1),
+    ("order_maximum_quantity", ("order_maximum_quantity", "OrderMaximumQuantity"), 10000),
+    ("disable_buy_button", ("disable_buy_button", "DisableBuyButton"), False),
+    ("disable_wishlist_button", ("disable_wishlist_button", "DisableWishlistButton"), False),
+    ("call_for_price", ("call_for_price", "CallForPrice"), False),
+    ("is_rental", ("is_rental", "IsRental"), False),
+    ("is_downloadable", ("is_download", "IsDownload"), False),
+    ("mark_as_new", ("mark_as_new", "MarkAsNew"), False),
+    ("images", ("images", "Images", "product_pictures", "ProductPictures"), list),
+    ("categories", ("categories", "Categories"), list),
+    ("tags", ("tags", "Tags", "product_tags", "ProductTags"), list),
+    ("attributes", ("attributes", "Attributes", "product_attributes", "ProductAttributes"), list),
+    ("tier_prices", ("tier_prices", "TierPrices"), list),
+    ("related_products", ("related_products", "RelatedProducts"), list),
+    ("cross_sell_products", ("cross_sells", "CrossSells"), list),
+)
+
+_CUSTOMER_FIELDS = (
+    ("id", ("id", "Id"), None),
+    ("customer_guid", ("customer_guid", "CustomerGuid"), None),
+    ("email", ("email", "Email"), None),
+    ("username", ("username", "Username", "email"), None),
+    ("first_name", ("first_name", "FirstName"), None),
+    ("last_name", ("last_name", "LastName"), None),
+    ("full_name", ("full_name", "FullName"), None),
+    ("gender", ("gender", "Gender"), None),
+    ("date_of_birth", ("date_of_birth", "DateOfBirth"), None),
+    ("company", ("company", "Company"), ""),
+    ("phone", ("phone", "Phone"), None),
+    ("fax", ("fax", "Fax"), ""),
+    ("vat_number", ("vat_number", "VatNumber"), ""),
+    ("vat_number_status", ("vat_number_status_id", "VatNumberStatusId"), None),
+    ("timezone_id", ("time_zone_id", "TimeZoneId"), None),
+    ("language_id", ("language_id", "LanguageId"), None),
+    ("currency_id", ("currency_id", "CurrencyId"), None),
+    ("is_active", ("is_active", "Active", "IsActive"), None),
+    ("deleted", ("deleted", "Deleted"), False),
+    ("is_system_account", ("is_system_account", "IsSystemAccount"), False),
+    ("system_name", ("system_name", "SystemName"), ""),
+    ("admin_comment", ("admin_comment", "AdminComment"), ""),
+    ("is_tax_exempt", ("is_tax_exempt", "IsTaxExempt"), False),
+    ("affiliate_id", ("affiliate_id", "AffiliateId"), None),
+    ("vendor_id", ("vendor_id", "VendorId"), None),
+    ("registered_in_store_id", ("registered_in_store_id", "RegisteredInStoreId"), None),
+    ("created_on", ("created_on_utc", "CreatedOnUtc"), None),
+    ("last_activity_date", ("last_activity_date_utc", "LastActivityDateUtc"), None),
+    ("last_login_date", ("last_login_date_utc", "LastLoginDateUtc"), None),
+    ("last_ip_address", ("last_ip_address", "LastIpAddress"), ""),
+    ("customer_roles", ("customer_roles", "CustomerRoles", "roles", "Roles"), list),
+    ("shopping_cart_items", ("shopping_cart_items", "ShoppingCartItems"), list),
+    ("reward_points_balance", ("reward_points_balance", "RewardPointsBalance"), 0),
+    ("has_orders", ("has_orders", "HasOrders"), False),
+    ("order_count", ("order_count", "OrderCount"), 0),
+    ("total_spent", ("total_spent", "TotalSpent"), 0),
+    ("avatar_url", ("avatar_url", "AvatarUrl"), ""),
+    ("newsletter_subscribed", ("newsletter_subscribed", "NewsletterSubscribed"), False),
+    ("custom_attributes", ("custom_customer_attributes", "CustomCustomerAttributes"), ""),
+)
+
+_ADDRESS_FIELDS = (
+    ("id", ("id", "Id"), None),
+    ("first_name", ("first_name", "FirstName"), ""),
+    ("last_name", ("last_name", "LastName"), ""),
+    ("email", ("email", "Email"), ""),
+    ("company", ("company", "Company"), ""),
+    ("country_id", ("country_id", "CountryId"), None),
+    ("country", ("country", "Country"), ""),
+    ("state_province_id", ("state_province_id", "StateProvinceId"), None),
+    ("state_province", ("state_province", "StateProvince"), ""),
+    ("county", ("county", "County"), ""),
+    ("city", ("city", "City"), ""),
+    ("address1", ("address1", "Address1"), ""),
+    ("address2", ("address2", "Address2"), ""),
+    ("zip_postal_code", ("zip_postal_code", "ZipPostalCode"), ""),
+    ("phone_number", ("phone_number", "PhoneNumber"), ""),
+    ("fax_number", ("fax_number", "FaxNumber"), ""),
+    ("custom_attributes", ("custom_attributes", "CustomAttributes"), ""),
+    ("created_on", ("created_on_utc", "CreatedOnUtc"), None),
+)
+
+_ORDER_FIELDS = (
+    ("id", ("id", "Id"), None),
+    ("order_guid", ("order_guid", "OrderGuid"), None),
+    ("order_number", ("custom_order_number", "order_number", "id", "Id"), None),
+    ("store_id", ("store_id", "StoreId"), None),
+    ("customer_id", ("customer_id", "CustomerId"), None),
+    ("customer_email", ("customer_email", "CustomerEmail"), ""),
+    ("customer_name", ("customer_name", "CustomerName"), ""),
+    ("customer_ip", ("customer_ip", "CustomerIp"), ""),
+    ("order_status", ("order_status", "OrderStatus", "status", "Status"), "Unknown"),
+    ("order_status_id", ("order_status_id", "OrderStatusId"), None),
+    ("payment_status", ("payment_status", "PaymentStatus"), None),
+    ("payment_status_id", ("payment_status_id", "PaymentStatusId"), None),
+    ("shipping_status", ("shipping_status", "ShippingStatus"), None),
+    ("shipping_status_id", ("shipping_status_id", "ShippingStatusId"), None),
+    ("payment_method", ("payment_method_system_name", "PaymentMethodSystemName"), ""),
+    ("card_type", ("card_type", "CardType"), ""),
+    ("card_name", ("card_name", "CardName"), ""),
+    ("card_number_masked", ("masked_credit_card_number", "MaskedCreditCardNumber"), ""),
+    ("authorization_transaction_id", ("authorization_transaction_id", "AuthorizationTransactionId"), ""),
+    ("capture_transaction_id", ("capture_transaction_id", "CaptureTransactionId"), ""),
+    ("paid_date", ("paid_date_utc", "PaidDateUtc"), None),
+    ("shipping_method", ("shipping_method", "ShippingMethod"), ""),
+    ("shipping_rate_provider", ("shipping_rate_computation_method_system_name", "ShippingRateComputationMethodSystemName"), ""),
+    ("tracking_number", ("tracking_number", "TrackingNumber"), ""),
+    ("shipped_date", ("shipped_date_utc", "ShippedDateUtc"), None),
+    ("delivery_date", ("delivery_date_utc", "DeliveryDateUtc"), None),
+    ("pickup_in_store", ("pickup_in_store", "PickupInStore"), False),
+    ("order_subtotal", ("order_subtotal_incl_tax", "OrderSubtotalInclTax", "order_subtotal", "OrderSubtotal"), 0),
+    ("order_subtotal_excl_tax", ("order_subtotal_excl_tax", "OrderSubtotalExclTax"), 0),
+    ("order_subtotal_discount", ("order_sub_total_discount_incl_tax", "OrderSubTotalDiscountInclTax"), 0),
+    ("order_shipping", ("order_shipping_incl_tax", "OrderShippingInclTax", "order_shipping", "OrderShipping"), 0),
+    ("order_shipping_excl_tax", ("order_shipping_excl_tax", "OrderShippingExclTax"), 0),
+    ("payment_method_additional_fee", ("payment_method_additional_fee_incl_tax", "PaymentMethodAdditionalFeeInclTax"), 0),
+    ("order_tax", ("order_tax", "OrderTax"), 0),
+    ("tax_rates", ("tax_rates", "TaxRates"), ""),
+    ("order_discount", ("order_discount", "OrderDiscount"), 0),
+    ("total", ("order_total", "OrderTotal", "total"), 0),
+    ("refunded_amount", ("refunded_amount", "RefundedAmount"), 0),
+    ("reward_points_earned", ("reward_points_history_entry_id", "RewardPointsHistoryEntryId"), None),
+    ("reward_points_used", ("redeemed_reward_points", "RedeemedRewardPoints"), 0),
+    ("reward_points_value", ("redeemed_reward_points_amount", "RedeemedRewardPointsAmount"), 0),
+    ("checkout_attribute_description", ("checkout_attribute_description", "CheckoutAttributeDescription"), ""),
+    ("customer_currency_code", ("customer_currency_code", "CustomerCurrencyCode"), ""),
+    ("currency_rate", ("currency_rate", "CurrencyRate"), 1),
+    ("affiliate_id", ("affiliate_id", "AffiliateId"), None),
+    ("customer_language_id", ("customer_language_id", "CustomerLanguageId"), None),
+    ("customer_tax_display_type", ("customer_tax_display_type_id", "CustomerTaxDisplayTypeId"), None),
+    ("vat_number", ("vat_number", "VatNumber"), ""),
+    ("allow_storing_credit_card", ("allow_storing_credit_card_number", "AllowStoringCreditCardNumber"), False),
+    ("deleted", ("deleted", "Deleted"), False),
+    ("created_on", ("created_on", "CreatedOn", "created_on_utc", "CreatedOnUtc"), None),
+    ("order_notes", ("order_notes", "OrderNotes"), list),
+    ("shipments", ("shipments", "Shipments"), list),
+    ("gift_cards", ("gift_card_usage_history", "GiftCardUsageHistory"), list),
+    ("discount_codes", ("discount_usage_history", "DiscountUsageHistory"), list),
+)
+
+# Slim projections for list views (search results, category listings).
+_PRODUCT_SUMMARY_FIELDS = (
+    ("id", ("id", "Id"), None),
+    ("name", ("name", "Name"), None),
+    ("short_description", ("short_description", "ShortDescription"), ""),
+    ("price", ("price", "Price"), 0),
+    ("stock_quantity", ("stock_quantity", "StockQuantity"), 0),
+)
+
+_CATEGORY_FIELDS = (
+    ("id", ("id", "Id"), None),
+    ("name", ("name", "Name"), None),
+    ("parent_id", ("parent_category_id", "ParentCategoryId"), None),
+)
+
+_ORDER_ITEM_FIELDS = (
+    ("id", ("id", "Id"), None),
+    ("order_item_guid", ("order_item_guid", "OrderItemGuid"), None),
+    ("product_id", ("product_id", "ProductId"), None),
+    ("product_name", ("product_name", "ProductName"), ""),
+    ("sku", ("sku", "Sku"), ""),
+    ("quantity", ("quantity", "Quantity"), 0),
+    ("unit_price_incl_tax", ("unit_price_incl_tax", "UnitPriceInclTax"), 0),
+    ("unit_price_excl_tax", ("unit_price_excl_tax", "UnitPriceExclTax"), 0),
+    ("price_incl_tax", ("price_incl_tax", "PriceInclTax"), 0),
+    ("price_excl_tax", ("price_excl_tax", "PriceExclTax"), 0),
+    ("discount_amount_incl_tax", ("discount_amount_incl_tax", "DiscountAmountInclTax"), 0),
+    ("discount_amount_excl_tax", ("discount_amount_excl_tax", "DiscountAmountExclTax"), 0),
+    ("original_product_cost", ("original_product_cost", "OriginalProductCost"), 0),
+    ("attribute_description", ("attribute_description", "AttributeDescription"), ""),
+    ("attributes_xml", ("attributes_xml", "AttributesXml"), ""),
+    ("download_count", ("download_count", "DownloadCount"), 0),
+    ("is_download_activated", ("is_download_activated", "IsDownloadActivated"), False),
+    ("license_download_id", ("license_download_id", "LicenseDownloadId"), None),
+    ("rental_start_date", ("rental_start_date_utc", "RentalStartDateUtc"), None),
+    ("rental_end_date", ("rental_end_date_utc", "RentalEndDateUtc"), None),
+    ("item_weight", ("item_weight", "ItemWeight"), None),
+)
+
+
+class NopCommerceService:
+    """
+    nopCommerce REST API Service
+    
+    Provides methods for:
+    - Customer authentication (login/logout/token management)
+    - Product operations (search, details, stock)
+    - Order operations (tracking, invoice, status updates)
+    """
+    
+    def __init__(self, api_url: str, secret_key: str, admin_username: Optional[str] = None, admin_password: Optional[str] = None, verify_ssl: bool = True):
+        """
+        Initialize the nopCommerce service.
+        
+        Args:
+            api_url: Base URL for the nopCommerce API (e.g., https://store.com/api)
+            secret_key: The API secret key generated in nopCommerce admin
+        """
+        self.api_url = api_url.rstrip('/')
+        # Admin/public endpoints hang off the site root, not /api; resolve once
+        # instead of re-slicing the URL on every request.
+        base_url = self.api_url[:-4] if self.api_url.endswith('/api') else self.api_url
+        self._admin_base_url = base_url
+        self._public_base_url = base_url
+        # %-template for admin URLs; '%' on two strs beats an f-string in the
+        # _admin_request hot path.
+        self._admin_url_tpl = base_url + '%s'
+        self.secret_key = secret_key
+        self.access_token = None
+        self.refresh_token = None
+        # Monotonic deadlines: float compare per request, immune to wall-clock jumps
+        self._token_expiry_mono: Optional[float] = None
+        self.admin_username = admin_username
+        self.admin_password = admin_password
+        self.admin_access_token = None
+        self._admin_token_expiry_mono: Optional[float] = None
+        self.admin_profile = None
+        self.verify_ssl = verify_ssl
+        # One TTL cache for the read-mostly lookups (categories, products,
+        # stock, admin profile); keys are (op, arg) tuples, values are
+        # (monotonic deadline, result). TTLs are chosen per operation at the
+        # call sites to match how fast each dataset actually changes.
+        self._cache: Dict[Tuple[str, Any], Tuple[float, Any]] = {}
+        # Per-instance alias tables re-ordered for the casing this server
+        # actually sends (keyed by id() of the generic table).
+        self._field_tables: Dict[int, Any] = {}
+        # Shared keep-alive session: avoids a fresh TCP+TLS handshake per call
+        self._session = requests.Session()
+        self._session.verify = verify_ssl
+        # Ask for compressed JSON; requests decompresses gzip transparently.
+        # (brotli is not a dependency, so we advertise gzip/deflate only.)
+        # Constant headers live on the session and are merged into every
+        # request by requests itself; per-call dicts only carry the deltas
+        # (Authorization, API key, PDF Accept override).
+        self._session.headers.update({
+            "Accept-Encoding": "gzip, deflate",
+            "Accept": "application/json",
+            "User-Agent": "NopCommerceService/1.0",
+        })
+        retries = Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        ssl_context = ssl.create_default_context()
+        if not verify_ssl:
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_NONE
+        self._session.mount("https://", _SSLContextAdapter(
+            ssl_context=ssl_context,
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=retries
+        ))
+        self._session.mount("http://", HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=retries
+        ))
+        self._admin_token_lock = threading.Lock()
+        # Remember which of the probed auth endpoints worked so later logins
+        # skip the failed attempts.
+        self._login_endpoint: Optional[str] = None
+        self._customer_info_endpoint: Optional[str] = None
+        # Winning endpoint index per public operation (endpoints embed record
+        # ids, so the position — not the formatted path — is what's stable).
+        self._endpoint_cache: Dict[str, int] = {}
+        # Whether the admin API is usable at all; None until first probe.
+        # When False we skip admin preflights entirely and re-probe only
+        # after a cooldown, so non-admin deployments don't pay a failed
+        # login on every request.
+        self._admin_available: Optional[bool] = None
+        self._admin_reprobe_at = 0.0
+        # Circuit breaker over the public probes: after repeated failures we
+        # stop hammering a dead API for a short window instead of paying
+        # full timeouts on every chat turn.
+        self._fail_count = 0
+        self._fail_window_start = 0.0
+        self._circuit_open_until = 0.0
+        # In-flight stock fetches keyed like the TTL cache (single-flight).
+        self._inflight: Dict[Tuple[str, Any], Future] = {}
+        self._inflight_lock = threading.Lock()
+        # (token, headers) pairs; rebuilt only when the respective token changes.
+        self._admin_headers_cache: Optional[Tuple[Optional[str], Dict[str, str]]] = None
+        self._auth_headers_cache: Optional[Tuple[Optional[str], Dict[str, str]]] = None
+
+    def _cache_get(self, key: Tuple[str, Any]) -> Optional[Any]:
+        """Return the cached value for *key* if present and not expired."""
+        entry = self._cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def _cache_put(self, key: Tuple[str, Any], value: Any, ttl: float) -> None:
+        """Cache *value* under *key* for *ttl* seconds."""
+        if len(self._cache) >= 1024:
+            self._cache.clear()
+        self._cache[key] = (time.monotonic() + ttl, value)
+
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _get_public_base_url(self) -> str:
+        """Get base URL for public API endpoints."""
+        return self._public_base_url
+    
+    # =========================================================================
+    # AUTHENTICATION
+    # =========================================================================
+    
+    def login(self, username: str, password: str) -> Dict[str, Any]:
+        """
+        Authenticate a customer/user with nopCommerce.
+        
+        Args:
+            username: Customer email or username
+            password: Customer password
+            
+        Returns:
+            Dict with 'success', 'access_token', 'customer_id', 'customer_name', 'error'
+        """
+        # Try different authentication endpoints based on common API plugin patterns.
+        # Once an endpoint has worked it is cached and hit directly; on a cold
+        # start all three are probed in parallel so login latency is the
+        # fastest endpoint's round-trip instead of the sum of all three.
+        if self._login_endpoint:
+            result = self._try_login_endpoint(self._login_endpoint, username, password)
+            if result.get("success"):
+                return result
+        else:
+            endpoints = [
+                "/token",  # SevenSpikes/api-plugin-for-nopcommerce
+                "/api-backend/Authenticate/GetToken",  # Official Web API
+                "/api/PublicCustomer/Login",  # NopAdvance
+            ]
+            with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+                futures = {
+                    executor.submit(self._try_login_endpoint, endpoint, username, password): endpoint
+                    for endpoint in endpoints
+                }
+                for future in as_completed(futures):
+                    result = future.result()
+                    if result.get("success"):
+                        self._login_endpoint = futures[future]
+                        for pending in futures:
+                            pending.cancel()
+                        return result
+        
+        # If none worked, return the last error
+        return {
+            "success": False,
+            "access_token": None,
+            "refresh_token": None,
+            "customer_id": None,
+            "customer_name": None,
+            "error": "Authentication failed. Please check your credentials and API configuration."
+        }
+    
+    def _try_login_endpoint(self, endpoint: str, username: str, password: str) -> Dict[str, Any]:
+        """Try a specific login endpoint."""
+        url = f"{self.api_url}{endpoint}"
+        
+        # Accept/User-Agent come from the session defaults.
+        headers = {"Content-Type": "application/json"}
+        
+        # Add API key header if available (for plugins that require it)
+        if self.secret_key:
+            headers["X-API-KEY"] = self.secret_key
+            headers["Authorization"] = f"Bearer {self.secret_key}"
+        
+        payload = _login_payload(endpoint, username, password)
+        
+        try:
+            response = self._session.post(url, headers=headers, data=_dump_json(payload), timeout=15)
+            
+            if response.status_code == 200:
+                data = _parse_json(response)
+                
+                # Handle different response formats from various plugins
+                access_token = (
+                    data.get("access_token") or 
+                    data.get("AccessToken") or 
+                    data.get("token") or
+                    data.get("Token")
+                )
+                
+                refresh_token = (
+                    data.get("refresh_token") or 
+                    data.get("RefreshToken")
+                )
+                
+                if access_token:
+                    self.access_token = access_token
+                    self.refresh_token = refresh_token
+                    
+                    # Calculate token expiry
+                    expires_in = data.get("expires_in", data.get("ExpiresIn", 3600))
+                    self._token_expiry_mono = time.monotonic() + int(expires_in)
+                    
+                    # Get customer info
+                    customer_info = self._get_current_customer()
+                    
+                    return {
+                        "success": True,
+                        "access_token": access_token,
+                        "refresh_token": refresh_token,
+                        "customer_id": customer_info.get("id") if customer_info else data.get("customer_id"),
+                        "customer_name": customer_info.get("name") if customer_info else username,
+                        "error": None
+                    }
+            
+            # Parse error message; only attempt a decode when the server says
+            # it sent JSON — unwinding a ValueError on HTML error pages is
+            # pure overhead.
+            error_msg = "Invalid username or password"
+            if "json" in response.headers.get("Content-Type", ""):
+                try:
+                    error_data = _parse_json(response)
+                    if isinstance(error_data, dict):
+                        error_msg = error_data.get("message") or error_data.get("Message") or error_msg
+                    elif isinstance(error_data, list) and len(error_data) > 0:
+                        error_msg = str(error_data[0])
+                except ValueError:
+                    pass
+            
+            return {
+                "success": False,
+                "access_token": None,
+                "refresh_token": None,
+                "customer_id": None,
+                "customer_name": None,
+                "error": error_msg
+            }
+            
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"Login attempt to {endpoint} failed: {e}")
+            return {
+                "success": False,
+                "access_token": None,
+                "refresh_token": None,
+                "customer_id": None,
+                "customer_name": None,
+                "error": f"Connection error: {str(e)}"
+            }
+    
+    def _get_current_customer(self) -> Optional[Dict[str, Any]]:
+        """Get current logged-in customer info."""
+        if not self.access_token:
+            return None
+
+        if self._customer_info_endpoint:
+            endpoints = [self._customer_info_endpoint]
+        else:
+            endpoints = [
+                "/customers/current",
+                "/api/customers/current",
+                "/api/PublicCustomer/GetCurrentCustomer"
+            ]
+            # Discover the live path with cheap HEADs first so the misses
+            # don't pay for full 404 response bodies. If the server rejects
+            # HEAD we fall through to probing all candidates with GET.
+            for endpoint in endpoints:
+                try:
+                    probe = self._session.head(
+                        f"{self.api_url}{endpoint}",
+                        headers=self._get_auth_headers(),
+                        timeout=5
+                    )
+                    if probe.status_code == 200:
+                        endpoints = [endpoint]
+                        break
+                except requests.exceptions.RequestException:
+                    continue
+
+        for endpoint in endpoints:
+            try:
+                url = f"{self.api_url}{endpoint}"
+                headers = self._get_auth_headers()
+                response = self._session.get(url, headers=headers, timeout=10)
+
+                if response.status_code == 200:
+                    self._customer_info_endpoint = endpoint
+                    data = _parse_json(response)
+                    # Handle nested response
+                    customer = data.get("customer") or data.get("Customer") or data
+                    return {
+                        "id": customer.get("id") or customer.get("Id"),
+                        "name": customer.get("first_name") or customer.get("FirstName") or customer.get("email"),
+                        "email": customer.get("email") or customer.get("Email"),
+                        "full_name": f"{customer.get('FirstName', '')} {customer.get('LastName', '')}".strip()
+                    }
+            except:
+                continue
+        
+        return None
+    
+    def refresh_access_token(self) -> bool:
+        """Refresh the access token using refresh token."""
+        if not self.refresh_token:
+            return False
+        
+        url = f"{self.api_url}/token"
+        headers = {"Content-Type": "application/json"}
+        payload = {
+            "grant_type": "refresh_token",
+            "refresh_token": self.refresh_token
+        }
+        
+        try:
+            response = self._session.post(url, headers=headers, data=_dump_json(payload), timeout=10)
+            if response.status_code == 200:
+                data = _parse_json(response)
+                self.access_token = data.get("access_token")
+                self.refresh_token = data.get("refresh_token", self.refresh_token)
+                expires_in = data.get("expires_in", 3600)
+                self._token_expiry_mono = time.monotonic() + int(expires_in)
+                return True
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Token refresh failed: {e}")
+        
+        return False
+    
+    def _get_auth_headers(self) -> Dict[str, str]:
+        """Get headers with authentication token.
+
+        Cached per token like _get_admin_headers; callers that need to add
+        headers (e.g. a PDF Accept) must copy before mutating.
+        """
+        cached = self._auth_headers_cache
+        if cached is not None and cached[0] == self.access_token:
+            return cached[1]
+        headers = {"Content-Type": "application/json"}
+
+        if self.access_token:
+            headers["Authorization"] = f"Bearer {self.access_token}"
+
+        if self.secret_key:
+            headers["X-API-KEY"] = self.secret_key
+
+        self._auth_headers_cache = (self.access_token, headers)
+        return headers
+
+    def _get_admin_base_url(self) -> str:
+        """Get base URL for admin API endpoints."""
+        return self._admin_base_url
+
+    def _get_admin_headers(self) -> Dict[str, str]:
+        """Get headers with admin authentication token.
+
+        The dict is cached per token so the per-request hot path
+        (_admin_request) does not rebuild it; callers must not mutate it.
+        """
+        cached = self._admin_headers_cache
+        if cached is not None and cached[0] == self.admin_access_token:
+            return cached[1]
+        headers = {"Content-Type": "application/json"}
+        if self.admin_access_token:
+            headers["Authorization"] = f"Bearer {self.admin_access_token}"
+        if self.secret_key:
+            headers["X-API-KEY"] = self.secret_key
+        self._admin_headers_cache = (self.admin_access_token, headers)
+        return headers
+
+    def _is_admin_token_valid(self) -> bool:
+        """Check if the current admin token is still valid."""
+        if not self.admin_access_token:
+            return False
+        if self._admin_token_expiry_mono is None:
+            return True
+        return time.monotonic() < self._admin_token_expiry_mono
+
+    @staticmethod
+    def _jwt_expiry(token: str) -> Optional[float]:
+        """Monotonic deadline from a JWT exp claim, with a 30s safety margin."""
+        try:
+            payload = token.split(".")[1]
+            payload += "=" * (-len(payload) % 4)
+            claims = json.loads(base64.urlsafe_b64decode(payload))
+            exp = claims.get("exp")
+            if exp:
+                return time.monotonic() + (int(exp) - time.time()) - 30
+        except Exception:
+            pass
+        return None
+
+    def admin_login(self, username: Optional[str] = None, password: Optional[str] = None) -> Dict[str, Any]:
+        """Authenticate as admin using the Admin API token endpoint."""
+        username = username or self.admin_username
+        password = password or self.admin_password
+        if not username or not password:
+            return {
+                "success": False,
+                "access_token": None,
+                "error": "Admin credentials are not configured."
+            }
+
+        url = self._admin_url_tpl % "/api/admin/token"
+        headers = {"Content-Type": "application/json"}
+        if self.secret_key:
+            headers["X-API-KEY"] = self.secret_key
+
+        payload = {
+            "username": username,
+            "password": password
+        }
+
+        try:
+            response = self._session.post(url, headers=headers, data=_dump_json(payload), timeout=15)
+            if response.status_code == 200:
+                data = _parse_json(response)
+                token = (
+                    data.get("AccessToken") or
+                    data.get("accessToken") or
+                    data.get("access_token") or
+                    data.get("token") or
+                    data.get("Token") or
+                    data.get("jwt")
+                )
+                if token:
+                    self.admin_access_token = token
+                    # Store admin user profile from token response
+                    self.admin_profile = {
+                        "username": username,
+                        "email": data.get("email") or data.get("Email") or username,
+                        "firstName": data.get("firstName") or data.get("FirstName") or data.get("first_name"),
+                        "lastName": data.get("lastName") or data.get("LastName") or data.get("last_name"),
+                        "name": f"{data.get('FirstName', '')} {data.get('LastName', '')}".strip()
+                        # data.get("name") or data.get("Name") or data.get("displayName") or data.get("DisplayName"),
+                    }
+                    expires_in = data.get("expires_in") or data.get("expiresIn")
+                    if expires_in:
+                        try:
+                            self._admin_token_expiry_mono = time.monotonic() + int(expires_in)
+                        except (ValueError, TypeError):
+                            self._admin_token_expiry_mono = self._jwt_expiry(token)
+                    else:
+                        # Fall back to the exp claim inside the JWT itself
+                        self._admin_token_expiry_mono = self._jwt_expiry(token)
+                    return {
+                        "success": True,
+                        "access_token": token,
+                        "error": None
+                    }
+
+            error_msg = "Admin authentication failed."
+            if "json" in response.headers.get("Content-Type", ""):
+                try:
+                    error_data = _parse_json(response)
+                    if isinstance(error_data, dict):
+                        error_msg = error_data.get("message") or error_data.get("Message") or error_msg
+                except ValueError:
+                    pass
+
+            return {
+                "success": False,
+                "access_token": None,
+                "error": error_msg
+            }
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Admin login failed: {e}")
+            return {
+                "success": False,
+                "access_token": None,
+                "error": f"Connection error: {str(e)}"
+            }
+
+    def _ensure_admin_token(self) -> bool:
+        """Ensure an admin token is available."""
+        # Serialize re-authentication so concurrent calls don't log in twice.
+        # Trust the expiry-based check; _admin_request already re-logs-in on
+        # 401/403, so revalidating via /api/admin/token/me per request just
+        # doubled the admin round-trip count.
+        with self._admin_token_lock:
+            if self._is_admin_token_valid():
+                return True
+            # Known-unavailable admin API: skip the login attempt until the
+            # cooldown elapses (creds may be configured mid-session).
+            if self._admin_available is False and time.monotonic() < self._admin_reprobe_at:
+                return False
+            result = self.admin_login()
+            ok = result.get("success", False)
+            self._admin_available = ok
+            if not ok:
+                self._admin_reprobe_at = time.monotonic() + 300
+            return ok
+
+    def _admin_request(self, method: str, path: str, **kwargs) -> Optional[requests.Response]:
+        """Perform an admin API request with automatic token handling."""
+        if not self._ensure_admin_token():
+            return None
+
+        url = self._admin_url_tpl % path
+        headers = kwargs.pop("headers", None) or self._get_admin_headers()
+        try:
+            response = self._session.request(method, url, headers=headers, timeout=15, **kwargs)
+            if response.status_code in [401, 403] and self.admin_username and self.admin_password:
+                if self.admin_login().get("success"):
+                    headers = self._get_admin_headers()
+                    response = self._session.request(method, url, headers=headers, timeout=15, **kwargs)
+            return response
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Admin request failed for {path}: {e}")
+            return None
+    
+    def is_token_valid(self) -> bool:
+        """Check if the current access token is still valid."""
+        if not self.access_token or self._token_expiry_mono is None:
+            return False
+        return time.monotonic() < self._token_expiry_mono
+
+    def _specialized_fields(self, record: Dict[str, Any], fields) -> Any:
+        """Return *fields* re-ordered for the key casing this server sends.
+
+        A given nopCommerce install only ever emits one casing, so after
+        sampling the first non-empty record we move that casing to the front
+        of every alias tuple — the alias scan then hits on the first key.
+        Mixed or changed casing still resolves via the remaining aliases.
+        """
+        spec = self._field_tables.get(id(fields))
+        if spec is None:
+            if not record:
+                return fields
+            pascal = sum(1 for k in record if k[:1].isupper())
+            if pascal > len(record) - pascal:
+                spec = tuple(
+                    (canon, tuple(sorted(keys, key=lambda k: not k[:1].isupper())), default)
+                    for canon, keys, default in fields
+                )
+            else:
+                spec = fields
+            self._field_tables[id(fields)] = spec
+        return spec
+
+    def _normalize_product(self, product: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize product data from different API formats."""
+        out = _apply_aliases(product, self._specialized_fields(product, _PRODUCT_FIELDS))
+        out["in_stock"] = out["stock_quantity"] > 0
+        out["average_rating"] = self._calculate_average_rating(product)
+        out["image_url"] = self._get_product_image(product)
+        return out
+
+    def _calculate_average_rating(self, product: Dict[str, Any]) -> float:
+        """Calculate average rating from approved rating sum and total reviews."""
+        rating_sum = _first(product, ("approved_rating_sum", "ApprovedRatingSum"), 0)
+        total_reviews = _first(product, ("approved_total_reviews", "ApprovedTotalReviews"), 0)
+        if total_reviews > 0:
+            return round(rating_sum / total_reviews, 2)
+        return 0.0
+
+    def _normalize_customer(self, customer: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize customer data."""
+        out = _apply_aliases(customer, self._specialized_fields(customer, _CUSTOMER_FIELDS))
+        if not out["full_name"]:
+            out["full_name"] = (
+                f"{customer.get('first_name', '')} {customer.get('last_name', '')}".strip()
+                or f"{customer.get('FirstName', '')} {customer.get('LastName', '')}".strip()
+            )
+        out["billing_address"] = self._normalize_address(_first(customer, ("billing_address", "BillingAddress")))
+        out["shipping_address"] = self._normalize_address(_first(customer, ("shipping_address", "ShippingAddress")))
+        out["addresses"] = [self._normalize_address(a) for a in _first(customer, ("addresses", "Addresses"), list)]
+        return out
+
+    def _normalize_address(self, address: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Normalize address data."""
+        if not address:
+            return None
+        return _apply_aliases(address, self._specialized_fields(address, _ADDRESS_FIELDS))
+
+    def _normalize_order(self, order: Dict[str, Any], with_items: bool = True) -> Dict[str, Any]:
+        """Normalize order data.
+
+        Args:
+            order: Raw order dict from any API format
+            with_items: If False, skip normalizing line items (list views)
+        """
+        out = _apply_aliases(order, self._specialized_fields(order, _ORDER_FIELDS))
+        out["pickup_address"] = self._normalize_address(_first(order, ("pickup_address", "PickupAddress")))
+        out["billing_address"] = self._normalize_address(_first(order, ("billing_address", "BillingAddress")))
+        out["shipping_address"] = self._normalize_address(_first(order, ("shipping_address", "ShippingAddress")))
+        raw_items = _first(order, ("order_items", "OrderItems", "items"), list)
+        out["items"] = [self._normalize_order_item(item) for item in raw_items] if with_items else []
+        out["total_items"] = _first(order, ("total_items", "TotalItems")) or len(raw_items)
+        return out
+
+    def _normalize_order_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize order item data."""
+        return _apply_aliases(item, self._specialized_fields(item, _ORDER_ITEM_FIELDS))
+
+    # =========================================================================
+    # ADMIN API
+    # =========================================================================
+
+    def admin_get_product(self, product_id: int) -> Dict[str, Any]:
+        """Get product details from Admin API."""
+        cached = self._cache_get(("admin_product", product_id))
+        if cached is not None:
+            return cached
+        response = self._admin_request("GET", f"/api/admin/products/{product_id}")
+        if response and response.status_code == 200:
+            data = _parse_json(response)
+            product = data.get("product") or data.get("Product") or data
+            result = {
+                "success": True,
+                "product": self._normalize_product(product),
+                "error": None
+            }
+            self._cache_put(("admin_product", product_id), result, ttl=60)
+            return result
+        return {
+            "success": False,
+            "product": None,
+            "error": f"Product with ID {product_id} not found."
+        }
+
+    def admin_get_product_stock(self, product_id: int) -> Dict[str, Any]:
+        """Get product stock from Admin API."""
+        # Stock and product detail are independent round-trips; overlap them
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            stock_future = executor.submit(self._admin_request, "GET", f"/api/admin/products/{product_id}/stock")
+            product_future = executor.submit(self.admin_get_product, product_id)
+            response = stock_future.result()
+            product_info = product_future.result()
+        if response and response.status_code == 200:
+            data = _parse_json(response)
+            stock_quantity = data.get("stockQuantity") or data.get("stock_quantity") or data.get("StockQuantity") or 0
+            product_name = None
+            sku = None
+            if product_info.get("success"):
+                product = product_info.get("product") or {}
+                product_name = product.get("name")
+                sku = product.get("sku")
+            return {
+                "success": True,
+                "product_id": product_id,
+                "product_name": product_name,
+                "stock_quantity": stock_quantity,
+                "in_stock": int(stock_quantity) > 0,
+                "sku": sku,
+                "error": None
+            }
+        return {
+            "success": False,
+            "product_id": product_id,
+            "product_name": None,
+            "stock_quantity": 0,
+            "in_stock": False,
+            "sku": None,
+            "error": f"Failed to get stock for product {product_id}."
+        }
+
+    def admin_update_product_stock(self, product_id: int, quantity: int) -> Dict[str, Any]:
+        """Update product stock via Admin API."""
+        payload = {"stockQuantity": quantity}
+        response = self._admin_request("POST", f"/api/admin/products/{product_id}/stock", data=_dump_json(payload))
+        if response and response.status_code == 200:
+            # The cached product (if any) now carries a stale stock figure.
+            self._cache.pop(("admin_product", product_id), None)
+            return {
+                "success": True,
+                "product_id": product_id,
+                "new_quantity": quantity,
+                "error": None
+            }
+        return {
+            "success": False,
+            "product_id": product_id,
+            "new_quantity": None,
+            "error": f"Failed to update stock for product {product_id}."
+        }
+
+    def admin_get_order(self, order_id: int) -> Dict[str, Any]:
+        """Get order details from Admin API."""
+        response = self._admin_request("GET", f"/api/admin/orders/{order_id}")
+        if response and response.status_code == 200:
+            data = _parse_json(response)
+            order = data.get("order") or data.get("Order") or data
+            return {
+                "success": True,
+                "order": self._normalize_order(order),
+                "error": None
+            }
+        return {
+            "success": False,
+            "order": None,
+            "error": f"Order with ID {order_id} not found."
+        }
+
+    def admin_update_order_status(self, order_id: int, new_status: str) -> Dict[str, Any]:
+        """Update order status via Admin API."""
+        try:
+            status_id = int(new_status)
+        except (TypeError, ValueError):
+            status_id = _ORDER_STATUS_MAP.get(str(new_status).strip().lower())
+
+        if status_id is None:
+            return {
+                "success": False,
+                "order_id": order_id,
+                "new_status": None,
+                "error": "Order status must be a valid status ID (e.g., 10, 20, 30, 40)."
+            }
+
+        payload = {"orderStatusId": status_id}
+        response = self._admin_request("POST", f"/api/admin/orders/{order_id}/status", data=_dump_json(payload))
+        if response and response.status_code == 200:
+            return {
+                "success": True,
+                "order_id": order_id,
+                "new_status": status_id,
+                "error": None
+            }
+        return {
+            "success": False,
+            "order_id": order_id,
+            "new_status": None,
+            "error": f"Failed to update status for order {order_id}."
+        }
+
+    def admin_get_order_invoice_pdf(self, order_id: int) -> Dict[str, Any]:
+        """Get order invoice from Admin API."""
+        # Stream the body in 64KB chunks instead of letting requests buffer
+        # response.content internally — multi-MB invoices otherwise sit in
+        # memory twice (raw + base64 copy).
+        response = self._admin_request("GET", f"/api/admin/orders/{order_id}/invoice",
+                                       headers={"Accept": "application/pdf"}, stream=True)
+        if response and response.status_code == 200:
+            try:
+                buf = bytearray()
+                for chunk in response.iter_content(chunk_size=65536):
+                    buf.extend(chunk)
+                body = bytes(buf)
+            finally:
+                response.close()
+            content_type = response.headers.get("Content-Type", "")
+            if "pdf" in content_type.lower() or body[:4] == b"%PDF":
+                # memoryview avoids an intermediate copy; ascii decode takes
+                # CPython's fast path (base64 output is always ASCII).
+                pdf_base64 = base64.b64encode(memoryview(body)).decode("ascii")
+                return {
+                    "success": True,
+                    "pdf_data": pdf_base64,
+                    "filename": f"invoice_order_{order_id}.pdf",
+                    "error": None
+                }
+            if "json" in content_type.lower():
+                try:
+                    data = json.loads(body) if orjson is None else orjson.loads(body)
+                    pdf_data = data.get("pdf") or data.get("pdf_data")
+                    if pdf_data:
+                        return {
+                            "success": True,
+                            "pdf_data": pdf_data,
+                            "filename": data.get("filename") or f"invoice_order_{order_id}.pdf",
+                            "error": None
+                        }
+                except ValueError:
+                    pass
+        return {
+            "success": False,
+            "pdf_data": None,
+            "filename": None,
+            "error": f"Failed to retrieve invoice for order {order_id}."
+        }
+
+    def admin_get_customer(self, customer_id: int) -> Dict[str, Any]:
+        """Get customer by ID from Admin API."""
+        response = self._admin_request("GET", f"/api/admin/customers/{customer_id}")
+        if response and response.status_code == 200:
+            data = _parse_json(response)
+            customer = data.get("customer") or data.get("Customer") or data
+            return {
+                "success": True,
+                "customer": self._normalize_customer(customer),
+                "error": None
+            }
+        return {
+            "success": False,
+            "customer": None,
+            "error": f"Customer with ID {customer_id} not found."
+        }
+
+    def admin_get_customer_details(self, customer_id: int) -> Dict[str, Any]:
+        """Get customer details from Admin API."""
+        response = self._admin_request("GET", f"/api/admin/customers/{customer_id}/details")
+        if response and response.status_code == 200:
+            data = _parse_json(response)
+            customer = data.get("customer") or data.get("Customer") or data
+            return {
+                "success": True,
+                "customer": self._normalize_customer(customer),
+                "details": data,
+                "error": None
+            }
+        return {
+            "success": False,
+            "customer": None,
+            "details": None,
+            "error": f"Customer details not found for ID {customer_id}."
+        }
+
+    def admin_find_product(self, identifier: str) -> Dict[str, Any]:
+        """Find product by identifier (SKU or name) via Admin API."""
+        response = self._admin_request("GET", f"/api/admin/products/find/{identifier}")
+        if response and response.status_code == 200:
+            data = _parse_json(response)
+            
+            # Check explicit 'found' flag if present
+            if "found" in data and not data["found"]:
+                 return {
+                    "success": False,
+                    "product": None,
+                    "error": f"Product not found for identifier '{identifier}'."
+                }
+
+            # Try to get product(s) from response
+            product = None
+            products = data.get("products") or data.get("Products")
+            
+            if products:
+                # If list, take first item
+                if isinstance(products, list) and len(products) > 0:
+                    product = products[0]
+                elif isinstance(products, dict):
+                    product = products
+            else:
+                 # Fallback: check for single 'product' key or use data itself if it looks like a product
+                 product = data.get("product") or data.get("Product") or data
+
+            if product:
+                return {
+                    "success": True,
+                    "product": self._normalize_product(product),
+                    "error": None
+                }
+        
+        return {
+            "success": False,
+            "product": None,
+            "error": f"Product not found for identifier '{identifier}'."
+        }
+
+    def admin_find_customer(self, query: str) -> Dict[str, Any]:
+        """Find customers by query string via Admin API."""
+        response = self._admin_request("GET", f"/api/admin/customers/find/{query}")
+        if response and response.status_code == 200:
+            data = _parse_json(response)
+            customers = data.get("customers") or data.get("Customers") or data
+            if isinstance(customers, dict):
+                customers = customers.get("items") or customers.get("Items") or [customers]
+            if not isinstance(customers, list):
+                customers = [customers] if customers else []
+            normalize = self._normalize_customer
+            return {
+                "success": True,
+                "customers": [normalize(c) for c in customers],
+                "error": None
+            }
+        return {
+            "success": False,
+            "customers": [],
+            "error": f"No customers found for '{query}'."
+        }
+
+    def admin_get_customer_last_orders(self, query: str, limit: int = 5) -> Dict[str, Any]:
+        """Get last N orders for a customer (by id or query) via Admin API."""
+        response = self._admin_request("GET", f"/api/admin/customers/{query}/orders/last/{limit}")
+        if response and response.status_code == 200:
+            data = _parse_json(response)
+            orders = data.get("orders") or data.get("Orders") or data
+            if isinstance(orders, dict):
+                orders = orders.get("items") or orders.get("Items") or [orders]
+            if not isinstance(orders, list):
+                orders = [orders] if orders else []
+            normalize = self._normalize_order
+            return {
+                "success": True,
+                "orders": [normalize(o) for o in orders],
+                "error": None
+            }
+        return {
+            "success": False,
+            "orders": [],
+            "error": f"No recent orders found for '{query}'."
+        }
+
+    def admin_iter_customer_last_orders(self, query: str, limit: int = 5) -> Iterator[Dict[str, Any]]:
+        """Yield a customer's recent orders one at a time, normalizing lazily.
+
+        Unlike admin_get_customer_last_orders this defers the (expensive)
+        per-order normalization until each order is consumed, so callers
+        that stop early — e.g. via itertools.islice — skip the rest.
+        """
+        response = self._admin_request("GET", f"/api/admin/customers/{query}/orders/last/{limit}")
+        if not response or response.status_code != 200:
+            return
+        data = _parse_json(response)
+        orders = data.get("orders") or data.get("Orders") or data
+        for order in _as_list(orders):
+            yield self._normalize_order(order)
+
+    def admin_get_token_me(self) -> Dict[str, Any]:
+        """Get current admin token profile info via Admin API."""
+        if not self.access_token:
+            return {
+                "success": False,
+                "profile": None,
+                "error": "No admin token available."
+            }
+
+        url = self._admin_url_tpl % "/api/admin/token/me"
+        headers = self._get_admin_headers()
+        try:
+            response = self._session.get(url, headers=headers, timeout=15)
+            if response.status_code == 200:
+                data = _parse_json(response)
+                return {
+                    "success": True,
+                    "profile": data,
+                    "error": None
+                }
+            return {
+                "success": False,
+                "profile": None,
+                "error": f"Failed to retrieve admin token profile (status {response.status_code})."
+            }
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Admin token/me request failed: {e}")
+            return {
+                "success": False,
+                "profile": None,
+                "error": f"Connection error: {str(e)}"
+            }
+
+    def admin_get_me(self) -> Dict[str, Any]:
+        """Get current admin user info via Admin API."""
+        # Ensure we have a valid admin token first
+        if not self._ensure_admin_token():
+            return {
+                "success": False,
+                "profile": None,
+                "error": "Could not authenticate with admin API."
+            }
+        
+        # Use stored profile from login response if available
+        if hasattr(self, 'admin_profile') and self.admin_profile:
+            return {
+                "success": True,
+                "profile": self.admin_profile,
+                "error": None
+            }
+
+        # Fallback: try the /api/admin/me endpoint
+        cached = self._cache_get(("admin_me", None))
+        if cached is not None:
+            return cached
+        return self._single_flight(("admin_me", None), self._fetch_admin_me)
+
+    def _fetch_admin_me(self) -> Dict[str, Any]:
+        """Fetch the admin profile from /api/admin/me (single-flight leader)."""
+        url = self._admin_url_tpl % "/api/admin/me"
+        headers = self._get_admin_headers()
+        try:
+            response = self._session.get(url, headers=headers, timeout=15)
+            if response.status_code == 200:
+                data = _parse_json(response)
+                result = {
+                    "success": True,
+                    "profile": data,
+                    "error": None
+                }
+                self._cache_put(("admin_me", None), result, ttl=600)
+                return result
+            return {
+                "success": False,
+                "profile": None,
+                "error": f"Failed to retrieve admin profile (status {response.status_code})."
+            }
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Admin /me request failed: {e}")
+            return {
+                "success": False,
+                "profile": None,
+                "error": f"Connection error: {str(e)}"
+            }
+    
+    # =========================================================================
+    # PRODUCTS
+    # =========================================================================
+    
+    def search_products(
+        self,
+        query: str = None,
+        category_id: int = None,
+        page: int = 1,
+        limit: int = 10
+    ) -> Dict[str, Any]:
+        """
+        Search for products via Admin API find endpoint.
+
+        Args:
+            query: Search keyword
+            category_id: Filter by category ID
+            page: Page number for pagination
+            limit: Number of results per page
+
+        Returns:
+            Dict with 'success', 'products', 'total_count', 'error'
+        """
+        if not query:
+            return {
+                "success": False,
+                "products": [],
+                "total_count": 0,
+                "error": "No search query provided."
+            }
+
+        # Use admin find endpoint: /api/admin/products/find/{query} (partial match on ID/SKU/name)
+        response = self._admin_request("GET", f"/api/admin/products/find/{query}")
+        if response and response.status_code == 200:
+            try:
+                data = _parse_json(response)
+
+                # Handle both single product and list responses
+                products = (
+                    data.get("products") or data.get("Products") or
+                    data.get("product") or data.get("Product") or
+                    data
+                )
+                if isinstance(products, dict):
+                    items = products.get("items") or products.get("Items")
+                    products = items if items else [products]
+                if not isinstance(products, list):
+                    products = [products] if products else []
+
+                normalized_products = []
+                for p in products[:limit]:
+                    summary = _apply_aliases(p, self._specialized_fields(p, _PRODUCT_SUMMARY_FIELDS))
+                    summary["in_stock"] = summary["stock_quantity"] > 0
+                    summary["image_url"] = self._get_product_image(p)
+                    normalized_products.append(summary)
+
+                return {
+                    "success": True,
+                    "products": normalized_products,
+                    "total_count": data.get("total_count") or len(normalized_products),
+                    "error": None
+                }
+            except Exception as e:
+                logger.error(f"Admin product find returned 200 but failed to parse: {e}")
+                return {
+                    "success": False,
+                    "products": [],
+                    "total_count": 0,
+                    "error": f"Failed to parse product search response: {e}"
+                }
+
+        # Log the failure
+        if response:
+            logger.error(f"Admin product find returned status {response.status_code} for query '{query}'")
+            error_msg = f"Product search failed with status {response.status_code}"
+        else:
+            logger.error(f"Admin product find request failed for query '{query}' (no response)")
+            error_msg = "Failed to connect to product search API."
+
+        return {
+            "success": False,
+            "products": [],
+            "total_count": 0,
+            "error": error_msg
+        }
+    
+    def _get_product_image(self, product: Dict) -> Optional[str]:
+        """Extract product image URL from various response formats."""
+        images = _first(product, ("images", "Images"))
+        if images:
+            return _first(images[0], ("src", "Src", "url", "Url"))
+
+        # Try direct image fields
+        return _first(product, ("image_url", "ImageUrl", "default_picture_url"))
+    
+    def _try_endpoints(
+        self,
+        op_key: str,
+        endpoints: List[str],
+        method: str = "GET",
+        ok_statuses: Tuple[int, ...] = (200,),
+        base: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs
+    ) -> Optional[requests.Response]:
+        """Probe candidate endpoints, remembering which one this server answers.
+
+        Returns the first response whose status is in *ok_statuses*, or None
+        when every candidate failed. The winning endpoint's index is cached
+        under *op_key*, so in steady state only one request is made; if the
+        cached endpoint stops answering the remaining candidates are reprobed
+        and the cache is updated.
+        """
+        if time.monotonic() < self._circuit_open_until:
+            logger.debug(f"{op_key} short-circuited: API circuit open")
+            return None
+        if base is None:
+            base = self.api_url
+        if headers is None:
+            headers = self._get_auth_headers()
+        cached_idx = self._endpoint_cache.get(op_key)
+        if cached_idx is None and method == "GET" and len(endpoints) > 1:
+            # Cold start: fire all candidate GETs at once so the latency is
+            # the fastest endpoint's round-trip, not the sum of the misses.
+            # Writes stay serial — a parallel probe could apply a PUT twice.
+            futures = {
+                _PROBE_POOL.submit(self._session.request, method, base + ep, headers=headers, **kwargs): i
+                for i, ep in enumerate(endpoints)
+            }
+            winner = None
+            for future in as_completed(futures):
+                try:
+                    response = future.result()
+                except requests.exceptions.RequestException as e:
+                    logger.debug(f"{op_key} at {endpoints[futures[future]]} failed: {e}")
+                    self._record_failure()
+                    continue
+                if response.status_code in ok_statuses:
+                    self._endpoint_cache[op_key] = futures[future]
+                    self._record_success()
+                    winner = response
+                    break
+            for future in futures:
+                future.cancel()
+            return winner
+        if cached_idx is None or cached_idx >= len(endpoints):
+            order = range(len(endpoints))
+        else:
+            order = [cached_idx] + [i for i in range(len(endpoints)) if i != cached_idx]
+        for i in order:
+            endpoint = endpoints[i]
+            try:
+                response = self._session.request(method, base + endpoint, headers=headers, **kwargs)
+            except requests.exceptions.RequestException as e:
+                logger.debug(f"{op_key} at {endpoint} failed: {e}")
+                self._record_failure()
+                continue
+            if response.status_code in ok_statuses:
+                self._endpoint_cache[op_key] = i
+                self._record_success()
+                return response
+            if response.status_code >= 500:
+                self._record_failure()
+        return None
+
+    def _record_success(self) -> None:
+        """Reset the circuit breaker after a healthy response."""
+        self._fail_count = 0
+        self._circuit_open_until = 0.0
+
+    def _record_failure(self) -> None:
+        """Count a failed request; open the circuit at 5 failures in 30s."""
+        now = time.monotonic()
+        if now - self._fail_window_start > 30:
+            self._fail_window_start = now
+            self._fail_count = 0
+        self._fail_count += 1
+        if self._fail_count >= 5:
+            self._circuit_open_until = now + 15
+            self._fail_count = 0
+            logger.warning("nopCommerce API circuit opened for 15s after repeated failures")
+
+    def get_product_details(self, product_id: int) -> Dict[str, Any]:
+        """
+        Get detailed information about a product.
+
+        Args:
+            product_id: The product ID
+
+        Returns:
+            Dict with 'success', 'product', 'error'
+        """
+        cached = self._cache_get(("prod", product_id))
+        if cached is not None:
+            return cached
+        admin_result = self.admin_get_product(product_id)
+        if admin_result.get("success"):
+            self._cache_put(("prod", product_id), admin_result, ttl=60)
+            return admin_result
+        response = self._try_endpoints(
+            "get_product_details",
+            [
+                f"/products/{product_id}",
+                f"/api/products/{product_id}",
+                f"/api/PublicCatalog/Product/{product_id}"
+            ],
+            base=self._public_base_url,
+            timeout=(3, 10)
+        )
+        if response is not None:
+            data = _parse_json(response)
+            product = data.get("product") or data.get("Product") or data
+            result = {
+                "success": True,
+                "product": self._normalize_product(product),
+                "error": None
+            }
+            self._cache_put(("prod", product_id), result, ttl=60)
+            return result
+
+        return {
+            "success": False,
+            "product": None,
+            "error": f"Product with ID {product_id} not found."
+        }
+    
+    def get_products_bulk(self, product_ids: List[int]) -> Dict[str, Any]:
+        """
+        Get details for several products at once.
+
+        None of the supported API plugins expose a bulk endpoint, so uncached
+        ids are fetched concurrently instead of one round-trip after another;
+        ids already in the TTL cache are served without any request.
+
+        Args:
+            product_ids: Product IDs to fetch (duplicates are collapsed)
+
+        Returns:
+            Dict with 'success', 'products' (in input order, misses skipped),
+            'errors' (id -> message) and 'error'
+        """
+        ids = list(dict.fromkeys(product_ids))
+        results: Dict[int, Dict[str, Any]] = {}
+        missing = []
+        for pid in ids:
+            cached = self._cache_get(("prod", pid))
+            if cached is not None:
+                results[pid] = cached
+            else:
+                missing.append(pid)
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(8, len(missing))) as executor:
+                for pid, result in zip(missing, executor.map(self.get_product_details, missing)):
+                    results[pid] = result
+
+        products = [results[pid]["product"] for pid in ids if results[pid].get("success")]
+        errors = {pid: results[pid].get("error") for pid in ids if not results[pid].get("success")}
+        return {
+            "success": bool(products),
+            "products": products,
+            "errors": errors,
+            "error": None if products else "No products could be retrieved."
+        }
+
+    def get_product_stock(self, product_id: int) -> Dict[str, Any]:
+        """
+        Get stock information for a product.
+        
+        Args:
+            product_id: The product ID
+            
+        Returns:
+            Dict with 'success', 'stock_quantity', 'in_stock', 'error'
+        """
+        # Stock moves faster than product data, so its TTL is deliberately short.
+        key = ("stock", product_id)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        # Single-flight: concurrent asks for the same id share one fetch.
+        return self._single_flight(key, lambda: self._fetch_product_stock(product_id))
+
+    def _single_flight(self, key: Tuple[str, Any], fetch) -> Any:
+        """Collapse concurrent identical lookups into one upstream call.
+
+        The first caller for a key becomes the leader and runs `fetch`;
+        everyone else blocks on the leader's Future and shares its result
+        (or exception). Prevents cache-expiry stampedes from multiplying
+        upstream requests.
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is None:
+                future = Future()
+                self._inflight[key] = future
+                leader = True
+            else:
+                leader = False
+        if not leader:
+            return future.result()
+        try:
+            result = fetch()
+            future.set_result(result)
+            return result
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _fetch_product_stock(self, product_id: int) -> Dict[str, Any]:
+        """Fetch stock for a product (admin fast path, public fallback)."""
+        admin_result = self.admin_get_product_stock(product_id)
+        if admin_result.get("success"):
+            self._cache_put(("stock", product_id), admin_result, ttl=15)
+            return admin_result
+        result = self.get_product_details(product_id)
+
+        if result["success"]:
+            product = result["product"]
+            stock_result = {
+                "success": True,
+                "product_id": product_id,
+                "product_name": product.get("name"),
+                "stock_quantity": product.get("stock_quantity", 0),
+                "in_stock": product.get("in_stock", False),
+                "sku": product.get("sku"),
+                "error": None
+            }
+            self._cache_put(("stock", product_id), stock_result, ttl=15)
+            return stock_result
+        
+        return {
+            "success": False,
+            "product_id": product_id,
+            "product_name": None,
+            "stock_quantity": 0,
+            "in_stock": False,
+            "sku": None,
+            "error": result.get("error", "Failed to get stock information.")
+        }
+    
+    def update_product_stock(self, product_id: int, quantity: int) -> Dict[str, Any]:
+        """
+        Update stock quantity for a product.
+        
+        Args:
+            product_id: The product ID
+            quantity: New stock quantity
+            
+        Returns:
+            Dict with 'success', 'new_quantity', 'error'
+        """
+        admin_result = self.admin_update_product_stock(product_id, quantity)
+        if admin_result.get("success"):
+            self._invalidate_product(product_id)
+            return admin_result
+        payload = {
+            "product": {
+                "id": product_id,
+                "stock_quantity": quantity,
+                "StockQuantity": quantity
+            }
+        }
+
+        response = self._try_endpoints(
+            "update_product_stock",
+            [
+                f"/products/{product_id}",
+                f"/api/products/{product_id}",
+            ],
+            method="PUT",
+            ok_statuses=(200, 204),
+            json=payload,
+            timeout=(3, 10)
+        )
+        if response is not None:
+            logger.info(f"Updated stock for product {product_id} to {quantity}")
+            self._invalidate_product(product_id)
+            return {
+                "success": True,
+                "product_id": product_id,
+                "new_quantity": quantity,
+                "error": None
+            }
+
+        return {
+            "success": False,
+            "product_id": product_id,
+            "new_quantity": None,
+            "error": "Failed to update stock. You may not have permission for this action."
+        }
+    
+    # =========================================================================
+    # ORDERS
+    # =========================================================================
+    
+    def get_customer_orders(
+        self, 
+        customer_id: int = None, 
+        status: str = None,
+        page: int = 1,
+        limit: int = 10
+    ) -> Dict[str, Any]:
+        """
+        Get orders for a customer.
+        
+        Args:
+            customer_id: The customer ID (if None, uses current logged-in customer)
+            status: Filter by order status
+            page: Page number
+            limit: Number of results per page
+            
+        Returns:
+            Dict with 'success', 'orders', 'total_count', 'error'
+        """
+        params = {
+            "page": page,
+            "limit": limit
+        }
+        
+        if customer_id:
+            params["customer_id"] = customer_id
+        
+        if status:
+            params["status"] = status
+        
+        response = self._try_endpoints(
+            "get_customer_orders",
+            [
+                "/orders",
+                "/api/orders",
+                "/api/PublicOrder/CustomerOrders"
+            ],
+            params=params,
+            timeout=(3, 10)
+        )
+        if response is not None:
+            data = _parse_json(response)
+            orders = _as_list(data.get("orders") or data.get("Orders") or data)
+
+            # Normalize order data (skip line items in list view)
+            normalized_orders = [self._normalize_order(o, with_items=False) for o in orders[:limit]]
+
+            return {
+                "success": True,
+                "orders": normalized_orders,
+                "total_count": data.get("total_count") or len(normalized_orders),
+                "error": None
+            }
+
+        return {
+            "success": False,
+            "orders": [],
+            "total_count": 0,
+            "error": "Failed to retrieve orders."
+        }
+    
+    def get_order_details(self, order_id: int) -> Dict[str, Any]:
+        """
+        Get detailed information about an order.
+        
+        Args:
+            order_id: The order ID
+            
+        Returns:
+            Dict with 'success', 'order', 'error'
+        """
+        admin_result = self.admin_get_order(order_id)
+        if admin_result.get("success"):
+            # Order is already normalized by admin_get_order
+            return admin_result
+        response = self._try_endpoints(
+            "get_order_details",
+            [
+                f"/orders/{order_id}",
+                f"/api/orders/{order_id}",
+                f"/api/PublicOrder/OrderDetails/{order_id}"
+            ],
+            timeout=(3, 10)
+        )
+        if response is not None:
+            data = _parse_json(response)
+            order = data.get("order") or data.get("Order") or data
+
+            return {
+                "success": True,
+                "order": self._normalize_order(order),
+                "error": None
+            }
+
+        return {
+            "success": False,
+            "order": None,
+            "error": f"Order with ID {order_id} not found."
+        }
+    
+    def track_order(self, order_id: int) -> Dict[str, Any]:
+        """
+        Get tracking information for an order.
+        
+        Args:
+            order_id: The order ID
+            
+        Returns:
+            Dict with 'success', 'tracking', 'error'
+        """
+        result = self.get_order_details(order_id)
+        
+        if result["success"]:
+            order = result["order"]
+            
+            # Determine tracking status message
+            status = order.get("order_status", "Unknown")
+            shipping_status = order.get("shipping_status", "Unknown")
+            payment_status = order.get("payment_status", "Unknown")
+            
+            tracking_message = _STATUS_MESSAGES.get(
+                shipping_status, 
+                _STATUS_MESSAGES.get(status, "Order status is being updated.")
+            )
+            
+            return {
+                "success": True,
+                "tracking": {
+                    "order_id": order_id,
+                    "order_number": order.get("order_number"),
+                    "order_status": status,
+                    "shipping_status": shipping_status,
+                    "payment_status": payment_status,
+                    "message": tracking_message,
+                    "total": order.get("total"),
+                    "created_on": order.get("created_on"),
+                    "items_count": len(order.get("items", [])),
+                    "total_items": order.get("total_items", 0)
+                },
+                "error": None
+            }
+        
+        return {
+            "success": False,
+            "tracking": None,
+            "error": result.get("error", "Failed to track order.")
+        }
+    
+    def get_order_invoice_pdf(self, order_id: int) -> Dict[str, Any]:
+        """
+        Get PDF invoice for an order.
+        
+        Args:
+            order_id: The order ID
+            
+        Returns:
+            Dict with 'success', 'pdf_data' (base64), 'filename', 'error'
+        """
+        admin_result = self.admin_get_order_invoice_pdf(order_id)
+        if admin_result.get("success"):
+            return admin_result
+        headers = dict(self._get_auth_headers())
+        headers["Accept"] = "application/pdf"
+        response = self._try_endpoints(
+            "get_order_invoice_pdf",
+            [
+                f"/orders/{order_id}/pdf",
+                f"/api/orders/{order_id}/pdf",
+                f"/api/PublicOrder/GetPdfInvoice/{order_id}"
+            ],
+            headers=headers,
+            timeout=(3, 30),
+            stream=True
+        )
+        if response is not None:
+            # Read in chunks rather than letting requests buffer the whole
+            # body; the base64 copy below is then the only full-size buffer.
+            try:
+                buf = bytearray()
+                for chunk in response.iter_content(chunk_size=65536):
+                    buf.extend(chunk)
+            finally:
+                response.close()
+
+            # Check if response is PDF
+            content_type = response.headers.get("Content-Type", "")
+
+            if "pdf" in content_type.lower() or buf[:4] == b'%PDF':
+                pdf_base64 = base64.b64encode(memoryview(buf)).decode('ascii')
+                return {
+                    "success": True,
+                    "pdf_data": pdf_base64,
+                    "filename": f"invoice_order_{order_id}.pdf",
+                    "error": None
+                }
+
+        return {
+            "success": False,
+            "pdf_data": None,
+            "filename": None,
+            "error": f"Failed to generate invoice for order {order_id}."
+        }
+    
+    def update_order_status(self, order_id: int, new_status: str) -> Dict[str, Any]:
+        """
+        Update the status of an order.
+        
+        Args:
+            order_id: The order ID
+            new_status: New order status (e.g., 'Processing', 'Complete', 'Cancelled')
+            
+        Returns:
+            Dict with 'success', 'new_status', 'error'
+        """
+        admin_result = self.admin_update_order_status(order_id, new_status)
+        if admin_result.get("success"):
+            return admin_result
+        # Map status names to nopCommerce status values
+        normalized_status = _STATUS_NAME_MAP.get(new_status.lower(), new_status)
+        
+        payload = {
+            "order": {
+                "id": order_id,
+                "order_status": normalized_status,
+                "OrderStatus": normalized_status
+            }
+        }
+
+        response = self._try_endpoints(
+            "update_order_status",
+            [
+                f"/orders/{order_id}",
+                f"/api/orders/{order_id}",
+            ],
+            method="PUT",
+            ok_statuses=(200, 204),
+            json=payload,
+            timeout=(3, 10)
+        )
+        if response is not None:
+            logger.info(f"Updated order {order_id} status to {normalized_status}")
+            return {
+                "success": True,
+                "order_id": order_id,
+                "new_status": normalized_status,
+                "error": None
+            }
+
+        return {
+            "success": False,
+            "order_id": order_id,
+            "new_status": None,
+            "error": "Failed to update order status. You may not have permission for this action."
+        }
+    
+    # =========================================================================
+    # CATEGORIES (Helper)
+    # =========================================================================
+    
+    def get_categories(self, parent_id: int = None) -> Dict[str, Any]:
+        """
+        Get product categories.
+        
+        Args:
+            parent_id: Filter by parent category ID
+            
+        Returns:
+            Dict with 'success', 'categories', 'error'
+        """
+        cached = self._cache_get(("categories", parent_id))
+        if cached is not None:
+            return cached
+        return self._single_flight(
+            ("categories", parent_id),
+            lambda: self._fetch_categories(parent_id)
+        )
+
+    def _fetch_categories(self, parent_id: int = None) -> Dict[str, Any]:
+        """Fetch and normalize categories (single-flight leader)."""
+        params = {}
+        if parent_id:
+            params["parent_category_id"] = parent_id
+        
+        response = self._try_endpoints(
+            "get_categories",
+            [
+                "/categories",
+                "/api/categories",
+                "/api/PublicCatalog/Categories"
+            ],
+            params=params,
+            timeout=(3, 10)
+        )
+        if response is not None:
+            data = _parse_json(response)
+            categories = _as_list(data.get("categories") or data.get("Categories") or data)
+
+            normalized_cats = [
+                _apply_aliases(c, self._specialized_fields(c, _CATEGORY_FIELDS))
+                for c in categories
+            ]
+
+            result = {
+                "success": True,
+                "categories": normalized_cats,
+                "error": None
+            }
+            self._cache_put(("categories", parent_id), result, ttl=300)
+            return result
+
+        return {
+            "success": False,
+            "categories": [],
+            "error": "Failed to retrieve categories."
+        }
+
+    def _invalidate_product(self, product_id: int) -> None:
+        """Drop every cached view of a product after a write."""
+        for op in ("prod", "stock", "admin_product"):
+            self._cache.pop((op, product_id), None)
+
+    def invalidate_categories(self):
+        """Clear the category cache (call after admin category edits)."""
+        for key in [k for k in self._cache if k[0] == "categories"]:
+            self._cache.pop(key, None)
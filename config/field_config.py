@@ -1,89 +1,133 @@
-import os
-import yaml
-from typing import Dict, Any, Optional
-
-class FieldConfig:
-    def __init__(self, field_name: str = 'it'):
-        """
-        Initialize field configuration.
-        
-        Args:
-            field_name: The field name (e.g., 'it', 'hr', 'finance'). Defaults to 'it'.
-        """
-        self.field_name = field_name.lower()
-        self.config = self._load_config()
-    
-    def _load_config(self) -> Dict[str, Any]:
-        """Load configuration for the specified field."""
-        try:
-            config_dir = os.path.join(os.path.dirname(__file__), 'fields')
-            config_path = os.path.join(config_dir, f"{self.field_name}.yaml")
-            
-            # Default to IT config if field config doesn't exist
-            if not os.path.exists(config_path):
-                config_path = os.path.join(config_dir, "it.yaml")
-                
-            with open(config_path, 'r', encoding='utf-8') as file:
-                return yaml.safe_load(file)
-                
-        except Exception as e:
-            # Fallback to default IT config
-            return {
-                'name': 'Support',
-                'greeting': 'Hello! How can I assist you today?',
-                'ticket_types': ['General Inquiry'],
-                'priorities': [
-                    {'name': 'High', 'description': 'High priority'},
-                    {'name': 'Medium', 'description': 'Medium priority'},
-                    {'name': 'Low', 'description': 'Low priority'}
-                ],
-                'responses': {
-                    'create_ticket': 'I\'ve created a support ticket for you.',
-                    'check_status': 'Let me check the status of your request.',
-                    'escalation': 'This has been escalated to the appropriate team.',
-                    'closing': 'Thank you for contacting support.'
-                },
-                'custom_fields': []
-            }
-    
-    def get(self, key: str, default: Any = None) -> Any:
-        """Get a configuration value by key."""
-        return self.config.get(key, default)
-    
-    def get_response(self, response_type: str, default: str = "") -> str:
-        """Get a response template by type."""
-        return self.config.get('responses', {}).get(response_type, default)
-    
-    def get_ticket_types(self) -> list:
-        """Get available ticket types for this field."""
-        return self.config.get('ticket_types', ['General'])
-    
-    def get_priorities(self) -> list:
-        """Get available priorities for this field."""
-        return self.config.get('priorities', [])
-    
-    def get_custom_fields(self) -> list:
-        """Get custom fields configuration for this field."""
-        return self.config.get('custom_fields', [])
-
-# Global field configuration manager
-class FieldConfigManager:
-    _instance = None
-    _configs = {}
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(FieldConfigManager, cls).__new__(cls)
-        return cls._instance
-    
-    @classmethod
-    def get_config(cls, field_name: str = 'it') -> FieldConfig:
-        """Get or create a field configuration."""
-        if field_name not in cls._configs:
-            cls._configs[field_name] = FieldConfig(field_name)
-        return cls._configs[field_name]
-
-# Helper function to get field configuration
-def get_field_config(field_name: str = 'it') -> FieldConfig:
-    """Helper function to get field configuration."""
-    return FieldConfigManager().get_config(field_name)
+import functools
+import os
+import threading
+from typing import Dict, Any, Optional
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml_file(config_path: str) -> Dict[str, Any]:
+    """Read and parse a field YAML once; repeat loads hit the cache.
+
+    yaml (and its libyaml extension) is imported here, on first parse,
+    so merely importing this module doesn't pay for the codec load.
+    The parsed dict is shared between callers, so treat it as read-only.
+    """
+    import yaml
+    try:
+        # libyaml-backed loader: ~10x faster than the pure-Python one.
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+    with open(config_path, 'r', encoding='utf-8') as file:
+        return yaml.load(file, Loader=SafeLoader)
+
+class FieldConfig:
+    def __init__(self, field_name: str = 'it'):
+        """
+        Initialize field configuration.
+        
+        Args:
+            field_name: The field name (e.g., 'it', 'hr', 'finance'). Defaults to 'it'.
+        """
+        self.field_name = field_name.lower()
+        self.config = self._load_config()
+        # Hoist the per-turn lookups once; accessors become plain reads
+        # instead of re-doing dict.get chains (and the empty-dict literal)
+        # on every utterance.
+        self._responses = self.config.get('responses') or {}
+        self._ticket_types = self.config.get('ticket_types') or ['General']
+        self._priorities = self.config.get('priorities') or []
+        self._custom_fields = self.config.get('custom_fields') or []
+    
+    def _load_config(self) -> Dict[str, Any]:
+        """Load configuration for the specified field."""
+        try:
+            config_dir = os.path.join(os.path.dirname(__file__), 'fields')
+            config_path = os.path.join(config_dir, f"{self.field_name}.yaml")
+            
+            # Default to IT config if field config doesn't exist
+            if not os.path.exists(config_path):
+                config_path = os.path.join(config_dir, "it.yaml")
+                
+            return _load_yaml_file(config_path)
+
+        except Exception as e:
+            # Fallback to default IT config
+            return {
+                'name': 'Support',
+                'greeting': 'Hello! How can I assist you today?',
+                'ticket_types': ['General Inquiry'],
+                'priorities': [
+                    {'name': 'High', 'description': 'High priority'},
+                    {'name': 'Medium', 'description': 'Medium priority'},
+                    {'name': 'Low', 'description': 'Low priority'}
+                ],
+                'responses': {
+                    'create_ticket': 'I\'ve created a support ticket for you.',
+                    'check_status': 'Let me check the status of your request.',
+                    'escalation': 'This has been escalated to the appropriate team.',
+                    'closing': 'Thank you for contacting support.'
+                },
+                'custom_fields': []
+            }
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a configuration value by key."""
+        return self.config.get(key, default)
+    
+    def get_response(self, response_type: str, default: str = "") -> str:
+        """Get a response template by type."""
+        return self._responses.get(response_type, default)
+    
+    def get_ticket_types(self) -> list:
+        """Get available ticket types for this field."""
+        return self._ticket_types
+    
+    def get_priorities(self) -> list:
+        """Get available priorities for this field."""
+        return self._priorities
+    
+    def get_custom_fields(self) -> list:
+        """Get custom fields configuration for this field."""
+        return self._custom_fields
+
+# Global field configuration manager
+class FieldConfigManager:
+    _instance = None
+    _configs = {}
+    _lock = threading.Lock()
+    
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(FieldConfigManager, cls).__new__(cls)
+        return cls._instance
+    
+    @classmethod
+    def get_config(cls, field_name: str = 'it') -> FieldConfig:
+        """Get or create a field configuration."""
+        # Lock-free fast path: dict reads are atomic under the GIL.
+        config = cls._configs.get(field_name)
+        if config is None:
+            with cls._lock:
+                config = cls._configs.get(field_name)
+                if config is None:
+                    config = cls._configs[field_name] = FieldConfig(field_name)
+        return config
+
+# Helper function to get field configuration
+def get_field_config(field_name: str = 'it') -> FieldConfig:
+    """Helper function to get field configuration."""
+    return FieldConfigManager().get_config(field_name)
+
+def _warm_cache():
+    """Preload every field YAML at import so first requests don't pay IO.
+
+    One sequential pass over config/fields/*.yaml at startup; after this,
+    get_config is a pure dict lookup for every known field.
+    """
+    import glob
+    fields_dir = os.path.join(os.path.dirname(__file__), 'fields')
+    for path in sorted(glob.glob(os.path.join(fields_dir, '*.yaml'))):
+        name = os.path.splitext(os.path.basename(path))[0]
+        FieldConfigManager._configs[name] = FieldConfig(name)
+
+_warm_cache()
@@ -1,79 +1,150 @@
-
-import os
-import sys
-
-# Add parent directory to path to import actions
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from actions.conversation_db import _get_connection, _fetchall_dict
-
-def chunk_text(text, chunk_size=600, overlap=100):
-   if not text:
-       return []
-   chunks = []
-   start = 0
-   while start < len(text):
-       end = start + chunk_size
-       if end < len(text):
-           # Try to break at newline or space
-           last_newline = text.rfind('\n', start, end)
-           if last_newline != -1 and last_newline > start + chunk_size // 2:
-               end = last_newline + 1
-           else:
-               last_space = text.rfind(' ', start, end)
-               if last_space != -1 and last_space > start + chunk_size // 2:
-                   end = last_space + 1
-       
-       chunk = text[start:end].strip()
-       if chunk:
-           chunks.append(chunk)
-       
-       start = end - overlap
-       if start < 0: start = 0
-   return chunks
-
-def populate_chunks():
-    conn = _get_connection()
-    try:
-        cursor = conn.cursor()
-        
-        # Clear existing chunks
-        print("Clearing old chunks...")
-        cursor.execute("TRUNCATE TABLE knowledge_base_chunks")
-        conn.commit()
-        
-        # Get articles
-        print("Fetching articles...")
-        cursor.execute("SELECT id, title, content FROM knowledge_base")
-        articles = _fetchall_dict(cursor)
-        print(f"Found {len(articles)} articles.")
-        
-        total_chunks = 0
-        for article in articles:
-            if not article['content']:
-                continue
-                
-            chunks = chunk_text(article['content'])
-            if not chunks:
-                continue
-                
-            for i, chunk in enumerate(chunks):
-                # Save raw chunk (search_kb checks title column separately now)
-                
-                cursor.execute(
-                    "INSERT INTO knowledge_base_chunks (article_id, content, chunk_index) VALUES (?, ?, ?)",
-                    (article['id'], chunk, i)
-                )
-                total_chunks += 1
-        
-        conn.commit()
-        print(f"Successfully created {total_chunks} chunks.")
-        
-    except Exception as e:
-        print(f"Error: {e}")
-        conn.rollback()
-    finally:
-        conn.close()
-
-if __name__ == "__main__":
-    populate_chunks()
+
+import os
+import re
+import sys
+from bisect import bisect_left
+
+# Add parent directory to path to import actions
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from actions.conversation_db import _get_connection, _fetchall_dict
+
+def _last_before(positions, lo, hi):
+   """Largest offset in the sorted list that falls in [lo, hi), else -1."""
+   idx = bisect_left(positions, hi) - 1
+   if idx >= 0 and positions[idx] >= lo:
+       return positions[idx]
+   return -1
+
+def chunk_text(text, chunk_size=600, overlap=100):
+   """Yield chunks lazily so large articles never sit fully chunked in RAM."""
+   if not text:
+       return
+   # Index every separator once up front; each boundary pick is then an
+   # O(log N) bisect instead of rfind re-scanning the window per chunk.
+   newlines = [m.start() for m in re.finditer('\n', text)]
+   spaces = [m.start() for m in re.finditer(' ', text)]
+   start = 0
+   while start < len(text):
+       end = start + chunk_size
+       if end < len(text):
+           # Try to break at newline or space
+           last_newline = _last_before(newlines, start, end)
+           if last_newline != -1 and last_newline > start + chunk_size // 2:
+               end = last_newline + 1
+           else:
+               last_space = _last_before(spaces, start, end)
+               if last_space != -1 and last_space > start + chunk_size // 2:
+                   end = last_space + 1
+       
+       chunk = text[start:end].strip()
+       if chunk:
+           yield chunk
+       
+       start = end - overlap
+       if start < 0: start = 0
+
+def populate_chunks():
+    conn = _get_connection()
+    try:
+        cursor = conn.cursor()
+        
+        # Clear existing chunks
+        print("Clearing old chunks...")
+        cursor.execute("TRUNCATE TABLE knowledge_base_chunks")
+        conn.commit()
+        
+        # Get articles
+        print("Fetching articles...")
+        cursor.execute("SELECT id, title, content FROM knowledge_base")
+        articles = _fetchall_dict(cursor)
+        print(f"Found {len(articles)} articles.")
+        
+        # Stream chunks into bounded executemany batches instead of a
+        # round-trip per chunk; fast_executemany ships each batch in bulk.
+        insert_sql = "INSERT INTO knowledge_base_chunks (article_id, content, chunk_index) VALUES (?, ?, ?)"
+        cursor.fast_executemany = True
+        total_chunks = 0
+        batch = []
+        for article in articles:
+            if not article['content']:
+                continue
+            for i, chunk in enumerate(chunk_text(article['content'])):
+                batch.append((article['id'], chunk, i))
+                if len(batch) >= 1000:
+                    cursor.executemany(insert_sql, batch)
+                    total_chunks += len(batch)
+                    batch = []
+        if batch:
+            cursor.executemany(insert_sql, batch)
+            total_chunks += len(batch)
+
+        conn.commit()
+        print(f"Successfully created {total_chunks} chunks.")
+        
+    except Exception as e:
+        print(f"Error: {e}")
+        conn.rollback()
+    finally:
+        conn.close()
+
+# Server-side rebuild: splits content with SUBSTRING over a tally CTE so
+# article text never crosses the wire. Windows are fixed-size (no snapping
+# to the nearest newline/space like chunk_text does) — acceptable for the
+# overlap-based retrieval in search_kb and vastly cheaper for large KBs.
+_REBUILD_PROC_SQL = """
+CREATE OR ALTER PROCEDURE sp_RebuildKBChunks
+    @size INT = 600,
+    @overlap INT = 100
+AS
+BEGIN
+    SET NOCOUNT ON;
+    TRUNCATE TABLE knowledge_base_chunks;
+    DECLARE @step INT = @size - @overlap;
+    WITH starts AS (
+        SELECT kb.id AS article_id,
+               kb.content,
+               v.n * @step + 1 AS start_pos,
+               v.n AS chunk_index
+        FROM knowledge_base kb
+        CROSS APPLY (
+            SELECT TOP ((LEN(kb.content) + @step - 1) / @step)
+                   ROW_NUMBER() OVER (ORDER BY (SELECT NULL)) - 1 AS n
+            FROM sys.all_objects
+        ) v
+        WHERE kb.content IS NOT NULL AND LEN(kb.content) > 0
+    )
+    INSERT INTO knowledge_base_chunks (article_id, content, chunk_index)
+    SELECT article_id,
+           LTRIM(RTRIM(SUBSTRING(content, start_pos, @size))),
+           chunk_index
+    FROM starts
+    WHERE LEN(LTRIM(RTRIM(SUBSTRING(content, start_pos, @size)))) > 0;
+END
+"""
+
+def populate_chunks_server_side():
+    """Rebuild all chunks inside SQL Server without pulling content to Python."""
+    conn = _get_connection()
+    try:
+        cursor = conn.cursor()
+        print("Installing sp_RebuildKBChunks...")
+        cursor.execute(_REBUILD_PROC_SQL)
+        conn.commit()
+        print("Rebuilding chunks server-side...")
+        cursor.execute("EXEC sp_RebuildKBChunks")
+        conn.commit()
+        cursor.execute("SELECT COUNT(*) FROM knowledge_base_chunks")
+        total_chunks = cursor.fetchone()[0]
+        print(f"Successfully created {total_chunks} chunks.")
+    except Exception as e:
+        print(f"Error: {e}")
+        conn.rollback()
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    if "--server-side" in sys.argv:
+        populate_chunks_server_side()
+    else:
+        populate_chunks()
@@ -9,7 +9,7 @@ import json
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from actions.conversation_db import create_theme, get_themes
+from actions.conversation_db import create_themes_bulk, get_themes
 
 # Define 8 distinct professional e-commerce themes
 DEFAULT_THEMES = [
@@ -160,29 +160,36 @@ DEFAULT_THEMES = [
 ]
 
 def main():
-    # Check existing themes
-    existing = get_themes()
-    existing_names = [t['name'] for t in existing]
+    # Check existing themes (single query; set for O(1) name lookups)
+    all_themes = get_themes()
+    existing_names = {t['name'] for t in all_themes}
 
-    print(f"Found {len(existing)} existing themes: {existing_names}")
+    print(f"Found {len(all_themes)} existing themes: {sorted(existing_names)}")
 
-    created = 0
+    missing = []
     for theme in DEFAULT_THEMES:
         if theme['name'] not in existing_names:
-            theme_id = create_theme(
-                theme['name'],
-                json.dumps(theme['settings']),
-                theme['is_default']
-            )
-            print(f"Created theme '{theme['name']}' with ID: {theme_id}")
-            created += 1
+            missing.append(theme)
         else:
             print(f"Theme '{theme['name']}' already exists, skipping")
 
-    print(f"\nDone! Created {created} new themes.")
+    # One transaction (and one fsync) for all new themes
+    new_ids = create_themes_bulk([
+        (t['name'], json.dumps(t['settings']), t['is_default'])
+        for t in missing
+    ])
+    for theme, theme_id in zip(missing, new_ids):
+        print(f"Created theme '{theme['name']}' with ID: {theme_id}")
+        # Track locally instead of re-querying the DB at the end
+        all_themes.append({
+            'id': theme_id,
+            'name': theme['name'],
+            'is_default': theme['is_default']
+        })
+
+    print(f"\nDone! Created {len(new_ids)} new themes.")
 
     # Show all themes
-    all_themes = get_themes()
     print(f"\nAll themes ({len(all_themes)}):")
     for t in all_themes:
         default_marker = " [DEFAULT]" if t.get('is_default') else ""
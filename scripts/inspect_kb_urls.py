@@ -1,28 +1,52 @@
-
-import sys
-import os
-
-# Add parent directory to path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from actions.conversation_db import _get_connection, _release_connection
-
-def inspect_urls():
-    conn = _get_connection()
-    try:
-        cursor = conn.cursor()
-        cursor.execute("SELECT TOP 10 title, url FROM knowledge_base")
-        rows = cursor.fetchall()
-        print(f"Found {len(rows)} rows.")
-        for row in rows:
-            print(f"Title: {row.title}")
-            print(f"URL: {row.url}")
-            print("-" * 40)
-            
-    except Exception as e:
-        print(f"Error: {e}")
-    finally:
-        _release_connection(conn)
-
-if __name__ == "__main__":
-    inspect_urls()
+
+import sys
+import os
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Block-buffer stdout: attached to a TTY it is line-buffered, which forces
+# a flush per newline and defeats the batched writes below.
+try:
+    sys.stdout.reconfigure(line_buffering=False)
+except (AttributeError, ValueError):
+    pass
+
+from contextlib import closing
+
+from actions.conversation_db import _get_connection, _release_connection
+
+def inspect_urls(limit=10):
+    conn = _get_connection()
+    try:
+        # closing() guarantees the cursor is released immediately rather
+        # than whenever GC gets to it, so the pooled connection goes back
+        # clean for the next caller.
+        with closing(conn.cursor()) as cursor:
+            # Stream in batches rather than materializing everything with
+            # fetchall; keeps memory flat if the TOP clause grows.
+            cursor.arraysize = 100
+            cursor.execute("SELECT TOP (?) title, url FROM knowledge_base", (limit,))
+            # Buffer one string per batch and write it in a single call so a
+            # line-buffered terminal doesn't flush on every row.
+            total = 0
+            separator = "-" * 40
+            while True:
+                batch = cursor.fetchmany()
+                if not batch:
+                    break
+                total += len(batch)
+                # Positional access skips pyodbc Row's per-attribute name lookup
+                sys.stdout.write("".join(
+                    f"Title: {row[0]}\nURL: {row[1]}\n{separator}\n"
+                    for row in batch
+                ))
+            print(f"Found {total} rows.")
+
+    except Exception as e:
+        print(f"Error: {e}")
+    finally:
+        _release_connection(conn)
+
+if __name__ == "__main__":
+    inspect_urls()
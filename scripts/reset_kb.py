@@ -11,16 +11,16 @@ def reset_kb():
     conn = _get_connection()
     try:
         cursor = conn.cursor()
-        print("Truncating knowledge_base_chunks...")
-        cursor.execute("TRUNCATE TABLE knowledge_base_chunks")
-        
-        print("Truncating knowledge_base (and resetting identity)...")
-        # Use DELETE if TRUNCATE fails due to FKs (which chunks was, but we just truncated it)
-        # Actually TRUNCATE TABLE knowledge_base might fail if referenced? 
-        # But we truncated the child table first.
-        cursor.execute("DELETE FROM knowledge_base")
-        cursor.execute("DBCC CHECKIDENT ('knowledge_base', RESEED, 0)")
-        
+        print("Resetting knowledge base...")
+        # One T-SQL batch, one round trip. The child table can be
+        # truncated, but SQL Server refuses TRUNCATE on any table that
+        # is the target of a foreign key (even an empty one), so the
+        # parent still needs DELETE plus an identity reseed.
+        cursor.execute("""
+            TRUNCATE TABLE knowledge_base_chunks;
+            DELETE FROM knowledge_base;
+            DBCC CHECKIDENT ('knowledge_base', RESEED, 0);
+        """)
         conn.commit()
         print("Knowledge Base reset successfully.")
             
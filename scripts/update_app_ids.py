@@ -23,26 +23,33 @@ def update_existing_data():
             return
         
         app_ids = ['IT', 'Accounting', 'HR', 'General']
-        
-        # Distribute conversations evenly across app_ids
+
+        # Distribute conversations evenly across app_ids, grouped so each
+        # (app_id, table) pair becomes one set-based UPDATE instead of a
+        # round trip per conversation.
+        groups = {app_id: [] for app_id in app_ids}
         for i, row in enumerate(rows):
-            conv_id = row[0]
-            app_id = app_ids[i % len(app_ids)]
-            
-            # Update conversation
-            cursor.execute("UPDATE conversations SET app_id = %s WHERE id = %s", (app_id, conv_id))
-            
-            # Update related messages
-            cursor.execute("UPDATE messages SET app_id = %s WHERE conversation_id = %s", (app_id, conv_id))
-            
-            # Update related feedback
-            cursor.execute("UPDATE feedback SET app_id = %s WHERE conversation_id = %s", (app_id, conv_id))
-            
-            # Update related actions
-            cursor.execute("UPDATE actions SET app_id = %s WHERE conversation_id = %s", (app_id, conv_id))
-            
-            print(f"Updated conversation {conv_id} -> {app_id}")
-        
+            groups[app_ids[i % len(app_ids)]].append(row[0])
+
+        tables = [
+            ('conversations', 'id'),
+            ('messages', 'conversation_id'),
+            ('feedback', 'conversation_id'),
+            ('actions', 'conversation_id'),
+        ]
+        for app_id, ids in groups.items():
+            # SQL Server caps parameters per statement (~2100), so chunk
+            # the IN list for very large databases.
+            for start in range(0, len(ids), 1000):
+                chunk = ids[start:start + 1000]
+                placeholders = ", ".join("?" for _ in chunk)
+                for table, column in tables:
+                    cursor.execute(
+                        f"UPDATE {table} SET app_id = ? WHERE {column} IN ({placeholders})",
+                        [app_id] + chunk
+                    )
+            print(f"Assigned {len(ids)} conversations -> {app_id}")
+
         conn.commit()
         print(f"\n✅ Updated {len(rows)} conversations with app_id values")
         
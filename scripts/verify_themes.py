@@ -1,23 +1,34 @@
-
-import sys
-import os
-import json
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from actions.conversation_db import get_themes
-
-def main():
-    try:
-        themes = get_themes()
-        print(f"Total Themes: {len(themes)}")
-        for t in themes:
-            if t['id'] == 6:
-                print(f"ID: {t['id']} | Name: {t['name']}")
-                print(f"Settings: {t['settings']}")
-    except Exception as e:
-        print(f"Error fetching themes: {e}")
-
-if __name__ == "__main__":
-    main()
+
+import sys
+import os
+import json
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from actions.conversation_db import get_theme, _get_connection, _release_connection
+
+def main():
+    try:
+        # Count server-side; get_themes() pulled every settings blob to
+        # Python just to filter for a single id here.
+        conn = _get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM themes")
+            total = cursor.fetchone()[0]
+        finally:
+            _release_connection(conn)
+        print(f"Total Themes: {total}")
+
+        theme = get_theme(6)
+        if theme:
+            print(f"ID: {theme['id']} | Name: {theme['name']}")
+            print(f"Settings: {theme['settings']}")
+        else:
+            print("Theme 6 not found.")
+    except Exception as e:
+        print(f"Error fetching themes: {e}")
+
+if __name__ == "__main__":
+    main()